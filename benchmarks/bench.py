@@ -0,0 +1,100 @@
+"""Time each conversion stage per language and print the results as JSON.
+
+    python benchmarks/bench.py [--repeat 5] [--output results.json]
+
+Every case is timed for tokenize, compute, compute_decimal,
+compute_multipliers, the end-to-end w2n call and the validate-only
+is_number_phrase call.  The JSON output is meant
+to be kept and diffed between versions.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import words2num  # noqa: E402
+from words2num import lang_EN_US, lang_ES_US  # noqa: E402
+
+
+CASES = {
+    'en': (lang_EN_US, {
+        'short': "two",
+        'compound': "sixty-eight billion, two hundred two million and two",
+        'huge': "nine hundred ninety nine centillion nine hundred "
+                "vigintillion",
+        'multiplier': "one thousand five hundred million",
+        'decimal': "ninety nine point " + " ".join(["nine", "oh"] * 16),
+    }),
+    'es': (lang_ES_US, {
+        'short': "dos",
+        'compound': "sesenta y ocho billones doscientos dos millones dos",
+        'huge': "novecientos noventa y nueve centillón novecientos "
+                "vigintillion",
+        'multiplier': "mil quinientos millones",
+        'decimal': "noventa y nueve punto " + " ".join(["nueve", "cero"] * 16),
+    }),
+}
+
+
+def time_call(fn, repeat):
+    """Return the best time per call in nanoseconds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def run(repeat):
+    results = []
+    for lang, (module, cases) in sorted(CASES.items()):
+        for case, text in sorted(cases.items()):
+            tokens, decimal_tokens, mul_tokens = module.tokenize(text)
+            stages = (
+                ('tokenize', lambda: module.tokenize(text)),
+                ('compute', lambda: module.compute(tokens)),
+                ('compute_decimal',
+                 lambda: module.compute_decimal(decimal_tokens)),
+                ('compute_multipliers',
+                 lambda: module.compute_multipliers(mul_tokens)),
+                ('w2n', lambda: words2num.w2n(text, lang)),
+                ('is_number_phrase',
+                 lambda: words2num.is_number_phrase(text, lang)),
+            )
+            for stage, fn in stages:
+                ns = time_call(fn, repeat)
+                results.append({
+                    'lang': lang,
+                    'case': case,
+                    'stage': stage,
+                    'ns_per_call': round(ns, 1),
+                    'calls_per_sec': round(1e9 / ns),
+                })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="timing runs per stage; the best is kept")
+    parser.add_argument('--output', help="file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = {
+        'words2num': words2num.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': run(args.repeat),
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Compare worker startup from language modules and from grammar artifacts.
+
+    python benchmarks/bench_artifact.py [--runs 20]
+
+Each sample starts a fresh interpreter, imports words2num and loads the
+en and es grammars either by importing their modules or by unpickling the
+artifacts written by words2num.artifact.save_language.  Load time and peak
+RSS are reported as JSON.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+
+from words2num.artifact import save_language  # noqa: E402
+
+
+LANGS = ('en', 'es')
+
+PROBE = """
+import resource, sys, time
+import words2num
+from words2num.artifact import load_language
+started = time.perf_counter()
+{0}
+elapsed = time.perf_counter() - started
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+FROM_MODULES = "for lang in {0!r}: words2num.base.get_language(lang)"
+FROM_ARTIFACTS = ("for lang in {0!r}:\n"
+                  "    words2num.register_language(\n"
+                  "        lang, load_language({1!r} + '/' + lang + '.w2n'))")
+
+
+def sample(snippet):
+    output = subprocess.check_output(
+        [sys.executable, '-c', PROBE.format(snippet)], cwd=ROOT)
+    elapsed, rss = output.decode().split()
+    return float(elapsed), int(rss)
+
+
+def summarize(name, samples):
+    times = sorted(elapsed for elapsed, _ in samples)
+    rss = sorted(kb for _, kb in samples)
+    return {
+        'case': name,
+        'best_ms': round(times[0] * 1e3, 3),
+        'median_ms': round(times[len(times) // 2] * 1e3, 3),
+        'median_max_rss_kb': rss[len(rss) // 2],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20,
+                        help="fresh interpreters per case")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    try:
+        sizes = {}
+        for lang in LANGS:
+            path = os.path.join(directory, lang + '.w2n')
+            save_language(lang, path)
+            sizes[lang] = os.path.getsize(path)
+        cases = (('modules', FROM_MODULES.format(LANGS)),
+                 ('artifacts', FROM_ARTIFACTS.format(LANGS, directory)))
+        results = [summarize(name, [sample(snippet)
+                                    for _ in range(args.runs)])
+                   for name, snippet in cases]
+    finally:
+        shutil.rmtree(directory)
+    print(json.dumps({'python': sys.version.split()[0],
+                      'artifact_bytes': sizes,
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Time importing words2num and the first English conversion, as JSON.
+
+    python benchmarks/bench_import.py [--runs 20]
+
+Each sample runs in a fresh interpreter, so it includes building the
+language tables that the import or first conversion triggers.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+SNIPPETS = {
+    'import': "import words2num",
+    'import_and_w2n_en': "import words2num; words2num.w2n('two')",
+}
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+{0}
+elapsed = time.perf_counter() - started
+loaded = sorted(m for m in sys.modules if m.startswith('words2num.lang_'))
+print(elapsed, ','.join(loaded))
+"""
+
+
+def sample(snippet):
+    output = subprocess.check_output(
+        [sys.executable, '-c', PROBE.format(snippet)], cwd=ROOT)
+    elapsed, loaded = output.decode().split(' ')
+    return float(elapsed), loaded.strip().split(',')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20,
+                        help="fresh interpreters per snippet")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, snippet in sorted(SNIPPETS.items()):
+        samples = [sample(snippet) for _ in range(args.runs)]
+        times = sorted(elapsed for elapsed, _ in samples)
+        results.append({
+            'case': name,
+            'best_ms': round(times[0] * 1e3, 3),
+            'median_ms': round(times[len(times) // 2] * 1e3, 3),
+            'languages_loaded': [m for m in samples[0][1] if m],
+        })
+    print(json.dumps({'python': sys.version.split()[0], 'results': results},
+                     indent=2))
+
+
+if __name__ == '__main__':
+    main()
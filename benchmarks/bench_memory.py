@@ -0,0 +1,86 @@
+"""Measure garbage collections and peak memory of large batch conversions.
+
+    python benchmarks/bench_memory.py [--phrases 1000000]
+
+For each language, a batch of mixed phrases is converted with w2n_batch
+and, separately, scanned into parsed phrases that are all kept, as a job
+that tokenizes first and computes later would.  Wall time, the number of
+collections of each GC generation and, from a separate traced run, the
+peak memory allocated are reported as JSON.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import words2num  # noqa: E402
+
+
+PHRASES = {
+    'en': ["two", "twenty five", "one hundred and two", "a thousand",
+           "sixty-eight billion, two hundred two million and two",
+           "ninety nine point nine", "one thousand five hundred million",
+           "nine hundred ninety nine centillion", "frogess", "one one"],
+    'es': ["dos", "veinticinco", "ciento dos", "mil",
+           "sesenta y ocho billones doscientos dos millones dos",
+           "noventa y nueve punto nueve", "mil quinientos millones",
+           "novecientos noventa y nueve centillón", "sapo", "uno uno"],
+}
+
+
+def collections():
+    return [generation['collections'] for generation in gc.get_stats()]
+
+
+def measure(case, fn, texts, lang):
+    fn(texts[:100])
+    gc.collect()
+    before = collections()
+    started = time.perf_counter()
+    fn(texts)
+    elapsed = time.perf_counter() - started
+    after = collections()
+
+    gc.collect()
+    tracemalloc.start()
+    fn(texts)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'lang': lang,
+        'case': case,
+        'phrases': len(texts),
+        'seconds': round(elapsed, 3),
+        'gc_collections': [b - a for a, b in zip(before, after)],
+        'peak_kb': peak // 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--phrases', type=int, default=1000000)
+    args = parser.parse_args(argv)
+
+    results = []
+    for lang, phrases in sorted(PHRASES.items()):
+        texts = [phrases[i % len(phrases)] for i in range(args.phrases)]
+        scan = words2num.base.get_language(lang).scan
+        cases = (
+            ('w2n_batch', lambda texts: words2num.w2n_batch(texts, lang,
+                                                            'ignore')),
+            ('scan', lambda texts: [scan(text) for text in texts]),
+        )
+        for case, fn in cases:
+            results.append(measure(case, fn, texts, lang))
+    print(json.dumps({'words2num': words2num.__version__,
+                      'python': sys.version.split()[0],
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -35,6 +35,71 @@ class TestITN(unittest.TestCase):
             except ValueError:
                 pass
 
+    def test_register_language(self):
+        """Test registering a locale defined only as data.
+        """
+        from words2num.core import ADD, MUL, MUL_HUNDRED, RET
+        words = {'eins': (1, 'D'), 'zwei': (2, 'D'), 'drei': (3, 'D'),
+                 'zwanzig': (20, 'T'), 'hundert': (100, 'H'),
+                 'tausend': (1000, 'X')}
+        edges = {('S', 'D'): ADD, ('S', 'T'): ADD, ('D', 'H'): MUL_HUNDRED,
+                 ('D', 'X'): MUL, ('H', 'D'): ADD, ('H', 'T'): ADD,
+                 ('H', 'X'): MUL, ('X', 'D'): ADD, ('T', 'F'): RET,
+                 ('D', 'F'): RET, ('H', 'F'): RET, ('X', 'F'): RET}
+        language = words2num.Language(words, edges, decimal_word='komma',
+                                      conjunction='und')
+        words2num.register_language('de', language)
+        try:
+            assert words2num.w2n("zwei tausend drei", 'de_AT') == 2003
+            assert words2num.w2n("drei hundert und zwanzig", 'de') == 320
+            assert words2num.w2n("zwei komma eins", 'de') == 2.1
+            try:
+                words2num.w2n("zwanzig drei", 'de')
+                assert False, "exception not raised for invalid sequence"
+            except words2num.NumberParseException:
+                pass
+        finally:
+            del words2num.base.LANGUAGES['de']
+            del words2num.base.CONVERTER_CLASSES['de']
+
+    def test_batch(self):
+        """Test batch conversion and its error policies.
+        """
+        trials = ["two", "frogess", "twenty-five", "one one"]
+
+        results = words2num.w2n_batch(trials, errors='ignore')
+        assert results == [2, None, 25, None], results
+
+        results = words2num.w2n_batch(iter(trials), errors='return')
+        assert results[0] == 2 and results[2] == 25
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[3], words2num.NumberParseException)
+
+        results = words2num.w2n_batch(["dos", "doce"], lang='es_TEST')
+        assert results == [2, 12], results
+
+        words2num.base.CONVERTER_CLASSES['xx'] = lambda text: len(text)
+        try:
+            results = words2num.w2n_batch(["ab", "abc"], 'xx', 'ignore')
+            assert results == [2, 3], results
+        finally:
+            del words2num.base.CONVERTER_CLASSES['xx']
+
+        results = words2num.w2n_batch(
+            ["two", "a point six sexdecillion centillion"], errors='ignore')
+        assert results == [2, None], results
+
+        results = words2num.w2n_isolated(["two", 5, "frogess"])
+        assert results[0] == 2, results
+        assert isinstance(results[1], AttributeError)
+        assert isinstance(results[2], ValueError)
+
+        try:
+            words2num.w2n_batch(trials)
+            assert False, "exception not raised for invalid batch"
+        except ValueError:
+            pass
+
 
 if __name__ == '__main__':
     unittest.main()
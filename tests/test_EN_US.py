@@ -1,8 +1,10 @@
 import unittest
 import random
-import sys
-from multiprocessing import Process
-from words2num import words2num, NumberParseException
+from decimal import Decimal
+from fractions import Fraction
+from words2num import words2num, w2n_try, w2n_parallel, NumberParseException
+from words2num import is_number_phrase
+from words2num import core
 from num2words import num2words
 
 
@@ -80,25 +82,96 @@ class TestEN_US(unittest.TestCase):
                    "'{0}' -> {1} != {2}".format(trial, result, target)
 
 
-    @unittest.skipIf(sys.version_info[0] < 3, 'python2 fails at concurrency')
+    def test_en_us_exact(self):
+        """Test exact Decimal and Fraction results.
+        """
+        digits = "nine " * 20
+        tests = (("point oh zero five", 'decimal', Decimal('0.005')),
+                 ("point oh zero five", 'fraction', Fraction(1, 200)),
+                 ("ninety nine point " + digits, 'decimal',
+                  Decimal('99.' + '9' * 20)),
+                 ("one point two five million", 'fraction', Fraction(1250000)),
+                 ("twelve", 'decimal', Decimal(12)))
+
+        for (trial, exact, target) in tests:
+            result = words2num(trial, exact=exact)
+            assert result == target and type(result) is type(target),\
+                   "'{0}' -> {1!r} != {2!r}".format(trial, result, target)
+
+    def test_en_us_fuzzy(self):
+        """Test misspelled input with fuzzy lookups.
+        """
+        tests = (("fourty two", 42),
+                 ("ninty nine hundered", 9900),
+                 ("two milion", 2000000))
+
+        for (trial, target) in tests:
+            result = words2num(trial, fuzzy=True)
+            assert result == target,\
+                   "'{0}' -> {1} != {2}".format(trial, result, target)
+            try:
+                words2num(trial)
+                assert False, "parsed misspelled input '{0}'".format(trial)
+            except ValueError:
+                pass
+
+    def test_en_us_try(self):
+        """Test non-raising conversion status codes and word indexes.
+        """
+        tests = (("twenty five", core.OK, None),
+                 ("one hundred and two frogess", core.INVALID_WORD, 3),
+                 ("", core.NO_TOKENS, None),
+                 ("two point one point", core.REPEATED_DECIMAL, 3),
+                 ("two thousand point", core.EMPTY_DECIMAL, 2),
+                 ("one point twenty", core.INVALID_DECIMAL, 2),
+                 ("nineteen twenty", core.INVALID_STATE, 1),
+                 ("one thousand one million one", core.INVALID_SEQUENCE, 3),
+                 ("a point six sexdecillion centillion", core.OVERFLOW, None),
+                 ("nine hundred vigintillion point five centillion",
+                  core.OVERFLOW, None))
+
+        for (trial, status, index) in tests:
+            result = w2n_try(trial)
+            assert (result.status, result.index) == (status, index),\
+                   "'{0}' -> {1}".format(trial, result)
+            if result.ok:
+                assert result.value == 25 and result.error() is None
+                continue
+            try:
+                words2num(trial)
+                assert False, "exception not raised for '{0}'".format(trial)
+            except (ValueError, NumberParseException) as e:
+                assert type(e) is type(result.error())
+                assert str(e) == result.message
+
+    def test_en_us_validate(self):
+        """Test validate-only checks without computing values.
+        """
+        valid = ("twenty five", "nine hundred vigintillion",
+                 "nine hundred ninety nine centillion nine hundred vigintillion",
+                 "one point five million", "a thousand and one")
+        invalid = ("one one", "nineteen twenty", "one point thousand",
+                   "one thousand one million one", "frogess", "",
+                   "a million billion thousand")
+
+        for trial in valid:
+            assert is_number_phrase(trial), trial
+        for trial in invalid:
+            assert not is_number_phrase(trial), trial
+            assert not w2n_try(trial).ok, trial
+
     def test_en_us_auto(self):
         """Test many (valid) inputs sampled from a wide range.
         Inputs are created by num2word.
         """
-        def inv_test(n):
-            words = num2words(n)
-            result = words2num(words)
-            assert n == result,\
-                   "{0} ({1}) inverted as {3}".format(n, words, result)
-
         _step = 64
-        for start_i in random.sample(range(9999999999999), 64):
-            plist = [Process(target=inv_test, args=(n,))\
-                     for n in range(start_i, start_i + _step)]
-            for p in plist:
-                p.start()
-            for p in plist:
-                p.join()
+        numbers = [n for start_i in random.sample(range(9999999999999), 64)
+                   for n in range(start_i, start_i + _step)]
+        words = [num2words(n) for n in numbers]
+        results = w2n_parallel(words, chunksize=_step)
+        for (n, trial, result) in zip(numbers, words, results):
+            assert n == result,\
+                   "{0} ({1}) inverted as {2}".format(n, trial, result)
 
 
     def test_en_us_neg(self):
@@ -0,0 +1,31 @@
+import asyncio
+import unittest
+import words2num
+from words2num.aio import AsyncConverter
+
+
+class TestAsync(unittest.TestCase):
+    """Test the asyncio front end.
+    """
+
+    def test_async(self):
+        """Test coalesced asyncio conversion, inline and offloaded.
+        """
+        async def convert(offload_size):
+            converter = AsyncConverter('en', max_batch_size=4,
+                                       offload_size=offload_size)
+            return await converter.convert_many(
+                ["two", "twenty five", "two", "frogess", "one one", "nine",
+                 5], return_exceptions=True)
+
+        for offload_size in (1, 100):
+            results = asyncio.run(convert(offload_size))
+            assert results[:3] == [2, 25, 2] and results[5] == 9, results
+            assert isinstance(results[3], ValueError)
+            assert isinstance(results[4], words2num.NumberParseException)
+            # only the phrase that raised fails, not its whole batch
+            assert isinstance(results[6], AttributeError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import os
+import tempfile
+import unittest
+from words2num.artifact import save_language, load_language
+
+
+class TestArtifact(unittest.TestCase):
+    """Test precompiled grammar artifacts.
+    """
+
+    def test_artifact(self):
+        """Test saving and loading a precompiled grammar.
+        """
+        fd, path = tempfile.mkstemp(suffix='.w2n')
+        os.close(fd)
+        try:
+            save_language('es', path)
+            language = load_language(path)
+        finally:
+            os.remove(path)
+        assert language.evaluate("dos mil punto cinco") == 2000.5
+        assert language.evaluate("dieciseis", fuzzy=True) == 16
+        assert language.vocab['mil'] is language.fuzzy_vocab['mil']
+
+
+if __name__ == '__main__':
+    unittest.main()
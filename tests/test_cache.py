@@ -0,0 +1,68 @@
+import traceback
+import unittest
+import words2num
+
+
+class TestCache(unittest.TestCase):
+    """Test the result cache.
+    """
+
+    def test_cache(self):
+        """Test the result cache shares entries between spellings.
+        """
+        words2num.set_cache_size(2)
+        try:
+            assert words2num.w2n("twenty five") == 25
+            assert words2num.w2n("Twenty-Five") == 25
+            for _ in range(2):
+                try:
+                    words2num.w2n("frogess")
+                    assert False, "exception not raised for cached failure"
+                except ValueError:
+                    pass
+            assert words2num.w2n_batch(["twenty five", "two"]) == [25, 2]
+            info = words2num.cache_info()
+            assert (info.hits, info.misses, info.evictions) == (3, 3, 1), info
+
+            # keys follow the language's own split, which only drops the
+            # conjunction after a separator
+            assert words2num.w2n(" and two") == 2
+            try:
+                words2num.w2n("and two")
+                assert False, "exception not raised for leading conjunction"
+            except ValueError:
+                pass
+
+            # every hit raises a new exception, for the text at hand, so
+            # tracebacks don't pile up on a shared one
+            errors = []
+            for text in ("frogess", "FROGESS", "frogess"):
+                try:
+                    words2num.w2n(text)
+                except ValueError as e:
+                    errors.append(e)
+            assert errors[0] is not errors[2]
+            assert str(errors[1]).endswith("in FROGESS"), errors[1]
+            depths = [len(traceback.extract_tb(e.__traceback__))
+                      for e in errors]
+            assert depths[0] == depths[2], depths
+
+            # converters may use the cache themselves
+            words2num.base.CONVERTER_CLASSES['xx'] = \
+                lambda text: words2num.w2n(text, 'en') * 2
+            try:
+                assert words2num.w2n("two", 'xx') == 4
+            finally:
+                del words2num.base.CONVERTER_CLASSES['xx']
+
+            words2num.set_cache_size(1)
+            assert words2num.cache_info().currsize == 1
+            words2num.cache_clear()
+            assert words2num.cache_info().currsize == 0
+        finally:
+            words2num.set_cache_size(None)
+        assert words2num.cache_info() is None
+
+
+if __name__ == '__main__':
+    unittest.main()
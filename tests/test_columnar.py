@@ -0,0 +1,43 @@
+import unittest
+from array import array
+from decimal import Decimal
+from words2num import w2n_try
+from words2num.core import OK, INVALID_WORD, INVALID_STATE, NO_TOKENS
+from words2num.columnar import vocabulary, encode, w2n_columnar
+
+
+class TestColumnar(unittest.TestCase):
+    """Test bulk conversion of packed token-id batches.
+    """
+
+    def test_columnar(self):
+        """Test values and error codes match text conversion.
+        """
+        trials = ["twenty five", "two point five", "one one",
+                  "one hundred and two million", "twenty five", "",
+                  "nine hundred centillion", "and three", "three and"]
+        ids, offsets = encode(trials)
+        values, errors = w2n_columnar(ids, offsets)
+        for (trial, value, error) in zip(trials, values, errors):
+            result = w2n_try(trial)
+            assert (value, error) == (result.value, result.status),\
+                   "'{0}' -> {1}, {2}".format(trial, value, error)
+        assert errors[2] == INVALID_STATE and errors[5] == NO_TOKENS
+
+        words = vocabulary('es')
+        ids = array('l', [words.index('dos'), words.index('punto'),
+                          words.index('cinco'), len(words), 7])
+        values, errors = w2n_columnar(ids, [0, 3, 4, 5], 'es_MX', 'decimal')
+        assert values[:2] == [Decimal('2.5'), None], values
+        assert values[2] == w2n_try(words[7], 'es', exact='decimal').value
+        assert list(errors) == [OK, INVALID_WORD, OK], errors
+
+        try:
+            encode(["twenty frogess"])
+            assert False, "exception not raised for unknown word"
+        except ValueError:
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from words2num import lang_EN_US
+from words2num.base import get_language
+from words2num.core import placevalue, LazyRegistry, ParsedPhrase
+
+
+class TestCore(unittest.TestCase):
+    """Test shared helpers.
+    """
+
+    def test_placevalue(self):
+        """Test placevalue against the digit count, including bignums.
+        """
+        trials = [0, 1, 9, 10, 99, 100, 999, 1000, 10**15 - 1, 10**15,
+                  2**53 + 1, 10**33 - 1, 10**33, 9 * 10**63, 10**303,
+                  10**303 - 1, 999 * 10**303]
+
+        for n in trials:
+            target = len(str(n)) - 1
+            result = placevalue(n)
+            assert result == target,\
+                   "placevalue({0}) -> {1} != {2}".format(n, result, target)
+
+        for (n, base, target) in ((1, 2, 0), (8, 2, 3), (255, 2, 7),
+                                  (4095, 16, 2), (4096, 16, 3)):
+            result = placevalue(n, base)
+            assert result == target,\
+                   "placevalue({0}, {1}) -> {2}".format(n, base, result)
+
+    def test_lazy_registry(self):
+        """Test that registry values load once, on first access.
+        """
+        loaded = []
+
+        def load(name):
+            loaded.append(name)
+            return (name,)
+
+        registry = LazyRegistry({'a': 'first', 'b': 'second'}, load)
+        registry['c'] = 'third'
+        registry['d'] = len
+        assert 'a' in registry and loaded == []
+        assert registry['a'] == ('first',) and registry['a'] == ('first',)
+        assert registry['d'] is len
+        assert loaded == ['first'], loaded
+        assert dict(registry.loaded_items()) == {'a': ('first',), 'd': len}
+        assert sorted(registry) == ['a', 'b', 'c', 'd']
+
+    def test_parsed_phrase(self):
+        """Test the compute stages accept a parsed phrase directly.
+        """
+        language = get_language('en')
+        trials = ("two", "one thousand five hundred million",
+                  "two thousand point oh five million", "point five")
+
+        for trial in trials:
+            phrase = language.scan(trial)
+            assert isinstance(phrase, ParsedPhrase) and not phrase.status
+            assert all(token is None or token is language.vocab[word]
+                       for token, word in zip(phrase, trial.split()))
+            tokens, decimal_tokens, mul_tokens = lang_EN_US.tokenize(trial)
+            assert lang_EN_US.compute(phrase) == lang_EN_US.compute(tokens)
+            assert lang_EN_US.compute_decimal(phrase, 'decimal') ==\
+                lang_EN_US.compute_decimal(decimal_tokens, 'decimal')
+            assert lang_EN_US.compute_multipliers(phrase) ==\
+                lang_EN_US.compute_multipliers(mul_tokens)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from words2num.extract import find_numbers, replace_numbers, replace_lines
+
+
+class TestExtract(unittest.TestCase):
+    """Test finding number phrases in running text.
+    """
+
+    def test_find_numbers(self):
+        """Test span offsets and values.
+        """
+        text = "I have twenty-five apples and one hundred and two oranges."
+        spans = list(find_numbers(text))
+        assert spans == [(7, 18, 25), (30, 49, 102)], spans
+        assert text[30:49] == "one hundred and two"
+
+        spans = list(find_numbers("nineteen twenty, a dog and one point"))
+        assert spans == [(0, 8, 19), (9, 15, 20), (27, 30, 1)], spans
+
+        # too large for a float: skipped rather than raised
+        text = "decillion a point six sexdecillion centillion and two"
+        spans = list(find_numbers(text))
+        assert spans == [(50, 53, 2)], spans
+
+    def test_replace_numbers(self):
+        """Test inverse text normalization of whole transcripts.
+        """
+        tests = (("Sixty-Eight billion, two hundred two million and two.",
+                  'en', "68202000002."),
+                 ("one thousand five hundred million and then some",
+                  'en', "1500000000 and then some"),
+                 ("it was two thousand point five. then point oh five",
+                  'en', "it was 2000.5. then 0.05"),
+                 ("tengo veintitrés años y dos mil quinientos pesos",
+                  'es', "tengo 23 años y 2500 pesos"))
+
+        for (text, lang, target) in tests:
+            result = replace_numbers(text, lang)
+            assert result == target,\
+                   "'{0}' -> {1} != {2}".format(text, result, target)
+
+    def test_replace_lines(self):
+        """Test lazy line and JSON lines rewriting.
+        """
+        lines = iter(["twenty five\n", "none\n"])
+        assert list(replace_lines(lines)) == ["25\n", "none\n"]
+
+        lines = ['{"id": 1, "text": "dos mil pesos"}\n', '{"id": 2}\n']
+        results = list(replace_lines(lines, 'es', field='text'))
+        assert results == ['{"id": 1, "text": "2000 pesos"}\n',
+                           '{"id": 2}\n'], results
+
+        invalid = []
+        lines = ['{"text": "two"\n', '[1]\n', '{"text": "two"}\n']
+        results = list(replace_lines(lines, field='text',
+                                     on_invalid=lambda *args:
+                                     invalid.append(args)))
+        assert results == lines[:2] + ['{"text": "2"}\n'], results
+        assert [number for number, _ in invalid] == [1, 2], invalid
+
+
+if __name__ == '__main__':
+    unittest.main()
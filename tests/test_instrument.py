@@ -0,0 +1,51 @@
+import unittest
+import words2num
+from words2num import core, instrument
+from words2num.engine import Language
+
+
+class TestInstrument(unittest.TestCase):
+    """Test opt-in conversion instrumentation.
+    """
+
+    def test_instrument(self):
+        """Test opt-in stage timings, counters and the callback hook.
+        """
+        original = Language._evaluate
+        records = []
+        instrument.reset()
+        instrument.enable(records.append)
+        try:
+            words2num.w2n_batch(["twenty five", "frogess", "one one",
+                                 "one point five million"], errors='ignore')
+            snapshot = instrument.snapshot()
+        finally:
+            instrument.disable()
+        assert Language._evaluate is original
+        stats = snapshot['en']
+        assert stats['calls'] == 4 and stats['tokens'] == 8, stats
+        assert stats['transitions'] == 7, stats
+        assert stats['statuses'] == {'OK': 2, 'INVALID_WORD': 1,
+                                     'INVALID_STATE': 1}, stats
+        assert set(stats['ns']) == set(instrument.STAGES)
+        assert [record['status'] for record in records] == \
+            ['OK', 'INVALID_WORD', 'INVALID_STATE', 'OK']
+        assert set(records[3]['ns']) == set(instrument.STAGES)
+
+        # stages run the engine's own code, so its fixes apply while on
+        instrument.enable()
+        try:
+            result = words2num.w2n_try("a point six sexdecillion centillion")
+        finally:
+            instrument.disable()
+        assert result.status == core.OVERFLOW, result
+        assert instrument.snapshot()['en']['statuses']['OVERFLOW'] == 1
+
+        words2num.w2n("two")
+        assert instrument.snapshot()['en']['calls'] == 5
+        instrument.reset()
+        assert instrument.snapshot() == {}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from decimal import Decimal
+from words2num import n2w, round_trip
+
+
+class TestN2W(unittest.TestCase):
+    """Test spelling numbers as words and parsing them back.
+    """
+
+    def test_n2w(self):
+        """Test spellings in both languages.
+        """
+        tests = ((0, 'en', "zero"),
+                 (21, 'en', "twenty-one"),
+                 (1001000, 'en', "one million one thousand"),
+                 (Decimal('2.50'), 'en', "two point five zero"),
+                 (999 * 10**303 + 12 * 10**63, 'en',
+                  "nine hundred ninety-nine centillion twelve vigintillion"),
+                 (100, 'es', "cien"),
+                 (101000, 'es', "ciento un mil"),
+                 (1001000, 'es', "un millón un mil"),
+                 (2031000000, 'es',
+                  "dos billones treinta y un millones"),
+                 (0.05, 'es', "cero punto cero cinco"))
+
+        for (number, lang, target) in tests:
+            result = n2w(number, lang)
+            assert result == target,\
+                   "{0} -> '{1}' != '{2}'".format(number, result, target)
+
+        for number in (-1, float('nan'), 10**70):
+            try:
+                n2w(number)
+                assert False, "exception not raised for: {0}".format(number)
+            except ValueError:
+                pass
+
+    def test_round_trip(self):
+        """Test w2n inverts n2w across magnitudes.
+        """
+        numbers = (list(range(2000)) +
+                   [7 * 10**exp + 10**exp // 3 for exp in range(3, 66)] +
+                   [123 * 10**303 + 10**66 - 1, 0.5, 99.99,
+                    Decimal('1000000.000')])
+        for lang in ('en', 'es'):
+            failures = round_trip(numbers, lang)
+            assert failures == [], failures[:5]
+
+
+if __name__ == '__main__':
+    unittest.main()
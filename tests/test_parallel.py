@@ -0,0 +1,19 @@
+import unittest
+import words2num
+
+
+class TestParallel(unittest.TestCase):
+    """Test pooled multi-process conversion.
+    """
+
+    def test_parallel(self):
+        """Test pooled batch conversion keeps input order.
+        """
+        trials = ["two", "frogess", "twenty-five", "one one"] * 5
+        results = words2num.w2n_parallel(trials, workers=2, chunksize=3,
+                                         errors='ignore')
+        assert results == [2, None, 25, None] * 5, results
+
+
+if __name__ == '__main__':
+    unittest.main()
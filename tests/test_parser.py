@@ -0,0 +1,63 @@
+import unittest
+from decimal import Decimal
+from words2num import w2n, Parser
+
+
+class TestParser(unittest.TestCase):
+    """Test incremental parsing one word at a time.
+    """
+
+    def test_prefixes(self):
+        """Test the value after every word matches w2n on the prefix.
+        """
+        trials = (("sixty-eight billion, two hundred two million and two",
+                   'en'),
+                  ("one thousand five hundred million", 'en'),
+                  ("two thousand point five million", 'en'),
+                  ("point oh five", 'en'),
+                  ("a hundred and twenty", 'en'),
+                  ("mil quinientos millones", 'es'),
+                  ("noventa y nueve punto nueve", 'es'))
+
+        for (text, lang) in trials:
+            parser = Parser(lang)
+            words = text.replace(',', '').replace('-', ' ').split()
+            for i, word in enumerate(words):
+                assert parser.feed(word), "rejected {0} in {1}".format(
+                    word, text)
+                try:
+                    target = w2n(' '.join(words[:i + 1]), lang)
+                except ValueError:
+                    target = None
+                value = parser.value_so_far()
+                assert value == target,\
+                       "'{0}' -> {1} != {2}".format(words[:i + 1], value,
+                                                    target)
+            assert parser.finalize() == w2n(text, lang)
+            assert parser.value_so_far() is None
+
+    def test_reject(self):
+        """Test a rejected word leaves the number before it intact.
+        """
+        parser = Parser()
+        assert parser.feed("Twenty-Five")
+        assert parser.feed("point")
+        assert parser.feed("five")
+        assert not parser.feed("point")
+        assert not parser.can_continue() and not parser.feed("five")
+        assert parser.finalize('decimal') == Decimal('25.5')
+        assert parser.can_continue()
+
+        for words in ([], ["one", "point"], ["million", "and"]):
+            parser = Parser()
+            for word in words:
+                parser.feed(word)
+            try:
+                parser.finalize()
+                assert False, "exception not raised for: {0}".format(words)
+            except ValueError:
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import http.client
+import json
+import threading
+import unittest
+from words2num.server import make_server
+
+
+class TestServer(unittest.TestCase):
+    """Test the local JSON conversion server.
+    """
+
+    def test_server(self):
+        """Test the JSON conversion server over a keep-alive connection.
+        """
+        server = make_server(port=0)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address)
+        try:
+            body = {'texts': ["two", "frogess", "point five"],
+                    'exact': 'decimal'}
+            for _ in range(2):
+                connection.request('POST', '/', json.dumps(body))
+                response = connection.getresponse()
+                reply = json.loads(response.read())
+                assert response.status == 200, reply
+                assert reply['results'] == ["2", None, "0.5"], reply
+                assert reply['errors'][1].startswith("Invalid number word")
+
+            for body in ({'texts': ["dos"], 'lang': '123'},
+                         {'texts': [5]}, {'texts': [None]}):
+                connection.request('POST', '/', json.dumps(body))
+                response = connection.getresponse()
+                response.read()
+                assert response.status == 400, body
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
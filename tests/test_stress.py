@@ -0,0 +1,43 @@
+import random
+import unittest
+from words2num import stress
+
+
+class TestStress(unittest.TestCase):
+    """Test the round-trip stress harness.
+    """
+
+    def test_run(self):
+        """Test every band and kind round-trips in both languages.
+        """
+        report = stress.run(count=20)
+        assert report['failures'] == 0,\
+               [cell['examples'] for cell in report['results']
+                if cell['failures']]
+        assert report['conversions'] ==\
+               20 * 2 * len(stress.BANDS) * len(stress.KINDS)
+        assert report['conversions_per_sec'] > 0
+
+    def test_workers(self):
+        """Test a process pool checks the same phrases as one process.
+        """
+        options = dict(langs=('es',), bands=('units', 'centillion'),
+                       count=20, seed=3)
+        serial = stress.run(**options)['results']
+        pooled = stress.run(workers=2, **options)['results']
+        key = lambda cell: (cell['band'], cell['kind'], cell['failures'])
+        assert [key(cell) for cell in serial] ==\
+               [key(cell) for cell in pooled]
+
+    def test_make_case(self):
+        """Test trailing multipliers are included in the expected value.
+        """
+        rng = random.Random(0)
+        for _ in range(200):
+            phrase, expected = stress.make_case('en', 'million',
+                                                'multiplier', rng)
+            assert expected >= 10**9, (phrase, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,10 @@
-from .base import (w2n)
+from .base import (w2n, w2n_try, w2n_batch, w2n_isolated, is_number_phrase,
+                   set_cache_size, cache_info, cache_clear, register_language)
 from .base import w2n as words2num
-from .core import (NumberParseException)
+from .core import (NumberParseException, ParseResult)
+from .engine import (Language)
+from .extract import (find_numbers, replace_numbers)
+from .parallel import (w2n_parallel)
+from .parser import (Parser)
+from .n2w import (n2w, round_trip)
 __version__ = '0.4.0'
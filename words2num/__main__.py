@@ -0,0 +1,67 @@
+"""Replace number phrases in text files or stdin.
+
+    python -m words2num [--lang en] [--field text] [-o OUTPUT] [INPUT ...]
+"""
+import argparse
+import io
+import sys
+import time
+
+from .extract import replace_lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m words2num',
+        description="Replace number phrases in text with digits, "
+                    "line by line.")
+    parser.add_argument('inputs', nargs='*', metavar='INPUT',
+                        help="files to read (default: stdin)")
+    parser.add_argument('-l', '--lang', default='en',
+                        help="language of the text (default: en)")
+    parser.add_argument('-f', '--field',
+                        help="treat input as JSON lines and rewrite FIELD")
+    parser.add_argument('-o', '--output',
+                        help="file to write (default: stdout)")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="don't report throughput on stderr")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        output = io.open(args.output, 'w', encoding='utf-8')
+    else:
+        output = sys.stdout
+    count = 0
+    started = time.perf_counter()
+    try:
+        for lines in _open_inputs(args.inputs):
+            for line in replace_lines(lines, args.lang, args.field,
+                                      _report_invalid):
+                output.write(line)
+                count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - started
+    if not args.quiet:
+        rate = count / elapsed if elapsed else 0.0
+        print("{0} lines in {1:.3f}s ({2:.0f} lines/sec)".format(
+            count, elapsed, rate), file=sys.stderr)
+
+
+def _report_invalid(number, line):
+    print("line {0}: not a JSON object, passed through".format(number),
+          file=sys.stderr)
+
+
+def _open_inputs(paths):
+    if not paths:
+        yield sys.stdin
+        return
+    for path in paths:
+        with io.open(path, encoding='utf-8') as lines:
+            yield lines
+
+
+if __name__ == '__main__':
+    main()
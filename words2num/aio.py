@@ -0,0 +1,104 @@
+"""asyncio front end that coalesces concurrent conversions into batches.
+"""
+import asyncio
+
+from .base import get_converter, w2n_isolated
+
+
+class AsyncConverter(object):
+    """Convert phrases for many concurrent awaiters in micro-batches.
+
+    Phrases awaited within max_wait seconds of each other, up to
+    max_batch_size distinct phrases, are converted together, and identical
+    in-flight phrases share one conversion.  Batches of at least
+    offload_size phrases run in executor (the loop's default executor when
+    None) so the event loop is never blocked by a large batch.
+
+        converter = AsyncConverter('en')
+        value = await converter.convert("twenty five")
+    """
+
+    def __init__(self, lang='en', max_batch_size=256, max_wait=0.001,
+                 offload_size=64, executor=None):
+        if max_batch_size < 1:
+            raise ValueError("Invalid batch size: {0}".format(max_batch_size))
+        # fail fast on unsupported languages
+        get_converter(lang)
+        self.lang = lang
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.offload_size = offload_size
+        self.executor = executor
+        # phrases waiting for the next batch, and phrases in offloaded
+        # batches, each mapped to the future shared by their awaiters
+        self._pending = {}
+        self._running = {}
+        self._flush_handle = None
+
+    async def convert(self, text):
+        """Return the value of text, raising like w2n on invalid input."""
+        future = self._pending.get(text) or self._running.get(text)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[text] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.max_wait,
+                                                     self._flush)
+        return await asyncio.shield(future)
+
+    async def convert_many(self, texts, return_exceptions=False):
+        """Convert texts concurrently, returning a list in input order.
+
+        With return_exceptions, failures are returned in place of values
+        instead of raising the first one.
+        """
+        return await asyncio.gather(*[self.convert(text) for text in texts],
+                                    return_exceptions=return_exceptions)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        texts = list(batch)
+        if len(texts) < self.offload_size:
+            self._resolve(batch, w2n_isolated(texts, self.lang))
+            return
+        self._running.update(batch)
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.executor, w2n_isolated, texts,
+                                    self.lang)
+        task.add_done_callback(lambda done: self._finish(batch, done))
+
+    def _finish(self, batch, done):
+        for text, future in batch.items():
+            if self._running.get(text) is future:
+                del self._running[text]
+        try:
+            results = done.result()
+        except Exception as e:
+            # the executor itself failed; phrases never raise out of
+            # w2n_isolated
+            self._fail(batch, e)
+        else:
+            self._resolve(batch, results)
+
+    @staticmethod
+    def _fail(batch, error):
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _resolve(batch, results):
+        for future, result in zip(batch.values(), results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
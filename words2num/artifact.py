@@ -0,0 +1,35 @@
+"""Save and load precompiled language grammars.
+
+A grammar artifact holds a Language's token table with placevalues, fuzzy
+lookup table and transition table as a single pickle, so worker processes
+can load it with one unpickle instead of rebuilding it from the language
+module.  Only load artifacts from trusted sources: unpickling can run
+arbitrary code.
+
+    python -m words2num.artifact LANG PATH
+"""
+import pickle
+import sys
+
+from .base import get_language
+
+
+def save_language(lang, path):
+    """Write the compiled grammar for lang to path."""
+    with open(path, 'wb') as f:
+        pickle.dump(get_language(lang), f, pickle.HIGHEST_PROTOCOL)
+
+
+def load_language(path):
+    """Read a compiled grammar written by save_language.
+
+    Register the result with words2num.register_language to use it.
+    """
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit(__doc__.rstrip().splitlines()[-1].strip())
+    save_language(sys.argv[1], sys.argv[2])
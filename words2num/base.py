@@ -1,25 +1,210 @@
-
 """Denormalize numbers, given normalized input.
 """
-from . import lang_EN_US
-from . import lang_ES_US
+from functools import partial
+from importlib import import_module
+
+from .cache import LRUCache
+from .core import NumberParseException, EXACT_MODES, LazyRegistry
+from .engine import Language
+
+
+def _load_language(name):
+    return import_module(name, __package__).LANGUAGE
+
+
+def _load_converter(name):
+    return _load_language(name).evaluate
 
 
-CONVERTER_CLASSES = {
-    'en': lang_EN_US.evaluate,
-    'en_US': lang_EN_US.evaluate,
-    'es': lang_ES_US.evaluate,
-    'es_US': lang_ES_US.evaluate,
-    'es_MX': lang_ES_US.evaluate,
+def _load_speller(name):
+    return import_module(name, __package__).spell
+
+
+# Language modules are named here and only imported on first lookup
+_MODULES = {
+    'en': '.lang_EN_US',
+    'en_US': '.lang_EN_US',
+    'es': '.lang_ES_US',
+    'es_US': '.lang_ES_US',
+    'es_MX': '.lang_ES_US',
 }
 
+LANGUAGES = LazyRegistry(_MODULES, _load_language)
+
+CONVERTER_CLASSES = LazyRegistry(_MODULES, _load_converter)
+
+# Number-to-words spellers; only the built-in languages have one
+SPELLERS = LazyRegistry(_MODULES, _load_speller)
+
+ERROR_POLICIES = ('raise', 'ignore', 'return')
+
+# Result cache shared by w2n and w2n_batch; None when disabled
+_cache = None
 
-def w2n(text, lang='en'):
+
+def _lookup(table, lang):
     # try the full language first
-    if lang not in CONVERTER_CLASSES:
+    if lang not in table:
         # then try first 2 letters
         lang = lang[:2]
-    if lang not in CONVERTER_CLASSES:
+    if lang not in table:
         raise NotImplementedError()
-    convert = CONVERTER_CLASSES[lang]
-    return convert(text)
+    return table[lang]
+
+
+def get_converter(lang='en'):
+    """Return the converter for lang, falling back to its first 2 letters."""
+    return _lookup(CONVERTER_CLASSES, lang)
+
+
+def get_language(lang='en'):
+    """Return the engine.Language for lang."""
+    return _lookup(LANGUAGES, lang)
+
+
+def get_speller(lang='en'):
+    """Return the function spelling integers in lang as words."""
+    return _lookup(SPELLERS, lang)
+
+
+def register_language(lang, language):
+    """Register an engine.Language, or the name of a module defining one as
+    LANGUAGE, under the language code lang (e.g. 'fr' or 'fr_CA').
+    """
+    LANGUAGES[lang] = language
+    if isinstance(language, str):
+        CONVERTER_CLASSES[lang] = language
+    else:
+        CONVERTER_CLASSES[lang] = language.evaluate
+
+
+def set_cache_size(maxsize):
+    """Enable or resize the result cache; a maxsize of 0 or None disables it.
+    """
+    global _cache
+    if not maxsize:
+        _cache = None
+    elif _cache is None:
+        _cache = LRUCache(maxsize)
+    else:
+        _cache.resize(maxsize)
+
+
+def cache_info():
+    """Return the hits, misses, evictions and size of the result cache."""
+    if _cache is None:
+        return None
+    return _cache.info()
+
+
+def cache_clear():
+    if _cache is not None:
+        _cache.clear()
+
+
+def _options(exact, fuzzy):
+    """Return the converter keyword arguments that differ from defaults."""
+    options = {}
+    if exact is not None:
+        if exact not in EXACT_MODES:
+            raise ValueError("Invalid exact mode: {0}".format(exact))
+        options['exact'] = exact
+    if fuzzy:
+        options['fuzzy'] = True
+    return options
+
+
+def w2n(text, lang='en', exact=None, fuzzy=False):
+    """Convert text to a number.
+
+    By default decimals are returned as floats; exact='decimal' or
+    exact='fraction' returns an exact Decimal or Fraction instead.  With
+    fuzzy=True, common misspellings and unaccented words are accepted.
+    """
+    options = _options(exact, fuzzy)
+    convert = get_converter(lang)
+    if _cache is not None:
+        return _cache.convert(convert, text, **options)
+    return convert(text, **options)
+
+
+def w2n_try(text, lang='en', exact=None, fuzzy=False):
+    """Convert text to a number without raising on invalid input.
+
+    Return a ParseResult of (value, status, index, text, language): status
+    is core.OK on success, otherwise a failure code with index pointing at
+    the offending word.  No exception is raised or message formatted for
+    invalid text until result.error() or result.message is used.  The
+    result cache is not consulted.
+    """
+    return get_language(lang).try_evaluate(text, **_options(exact, fuzzy))
+
+
+def is_number_phrase(text, lang='en', fuzzy=False):
+    """Return True if text is a valid number phrase, without converting it.
+
+    Only the grammar is checked, which is much cheaper than w2n for
+    large-magnitude phrases.
+    """
+    return not get_language(lang).check(text, fuzzy)[0]
+
+
+def w2n_batch(texts, lang='en', errors='raise', exact=None, fuzzy=False):
+    """Convert every phrase in texts, returning a list in input order.
+
+    The converter for lang is resolved once for the whole batch.  errors
+    controls what happens when a phrase fails to parse: 'raise' propagates
+    the exception, 'ignore' stores None and 'return' stores the exception
+    object in place of the value.  exact and fuzzy are passed on as in w2n.
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError("Invalid error policy: {0}".format(errors))
+    options = _options(exact, fuzzy)
+    convert = get_converter(lang)
+    language = getattr(convert, '__self__', None)
+    if not isinstance(language, Language) or convert != language.evaluate:
+        # converters registered as plain functions take the loop below
+        language = None
+    if errors == 'ignore' and _cache is None and language is not None:
+        # failures need no exception at all
+        try_evaluate = language.try_evaluate
+        return [try_evaluate(text, **options).value for text in texts]
+    convert = _bind(convert, options)
+    if errors == 'raise':
+        return [convert(text) for text in texts]
+    results = []
+    append = results.append
+    for text in texts:
+        try:
+            append(convert(text))
+        except (ValueError, NumberParseException) as e:
+            append(None if errors == 'ignore' else e)
+    return results
+
+
+def w2n_isolated(texts, lang='en', exact=None, fuzzy=False):
+    """Like w2n_batch(texts, lang, 'return', exact, fuzzy), except that any
+    exception a phrase raises, not only a parse error, is returned in its
+    place, so one bad item never fails the rest of the batch.
+
+    For front ends whose batches merge unrelated requests; an unsupported
+    lang or exact mode still raises.
+    """
+    convert = _bind(get_converter(lang), _options(exact, fuzzy))
+    results = []
+    append = results.append
+    for text in texts:
+        try:
+            append(convert(text))
+        except Exception as e:
+            append(e)
+    return results
+
+
+def _bind(convert, options):
+    """Return convert with options applied, through the cache if enabled."""
+    if _cache is not None:
+        return partial(_cache.convert, convert, **options)
+    if options:
+        return partial(convert, **options)
+    return convert
@@ -0,0 +1,124 @@
+"""Bounded memoization of conversion results.
+"""
+from collections import OrderedDict, namedtuple
+import threading
+
+from .core import NumberParseException
+from .engine import Language
+
+
+CacheInfo = namedtuple('CacheInfo',
+                       ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+def normalize(convert, text):
+    """Return the cache key for text.
+
+    For a Language's evaluate this is the word sequence the language
+    splits text into, so phrases with the same key always convert to the
+    same result; other converters are keyed on the text itself.
+    """
+    split = getattr(getattr(convert, '__self__', None), 'split', None)
+    if split is None:
+        return text
+    return tuple(split(text))
+
+
+def _language(convert):
+    """Return the engine.Language whose evaluate convert is, or None."""
+    language = getattr(convert, '__self__', None)
+    if isinstance(language, Language) and convert == language.evaluate:
+        return language
+    return None
+
+
+class LRUCache(object):
+    """Least-recently-used cache of conversion results.
+
+    Entries are keyed on the converter, its options and the normalized
+    token sequence, so "Twenty-Five" and "twenty five" share one entry.
+    Parse failures are stored as negative entries, and a fresh exception
+    for the text at hand is raised on each hit.  The cache may be shared
+    between threads; conversions run outside its lock.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def convert(self, convert, text, **options):
+        key = (convert, tuple(sorted(options.items())),
+               normalize(convert, text))
+        language = _language(convert)
+        entries = self._entries
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                entries.move_to_end(key)
+        if entry is None:
+            entry = self._compute(language, convert, text, options)
+            with self._lock:
+                if key in entries:
+                    # another thread converted the same key meanwhile
+                    entry = entries[key]
+                    self.hits += 1
+                    entries.move_to_end(key)
+                else:
+                    self.misses += 1
+                    entries[key] = entry
+                    if len(entries) > self.maxsize:
+                        entries.popitem(last=False)
+                        self.evictions += 1
+        value, failure = entry
+        if failure is None:
+            return value
+        if language is not None:
+            status, index = failure
+            raise language.error(status, index, text)
+        error_class, args = failure
+        raise error_class(*args)
+
+    @staticmethod
+    def _compute(language, convert, text, options):
+        """Return (value, None), or (None, failure) where failure is the
+        (status, index) of a Language's conversion or the exception type
+        and arguments another converter raised.
+        """
+        if language is not None:
+            result = language.try_evaluate(text, **options)
+            if result.status:
+                return None, (result.status, result.index)
+            return result.value, None
+        try:
+            return convert(text, **options), None
+        except (ValueError, NumberParseException) as e:
+            return None, (type(e), e.args)
+
+    def resize(self, maxsize):
+        """Change the capacity, evicting the oldest entries if needed."""
+        if maxsize < 1:
+            raise ValueError("Invalid cache size: {0}".format(maxsize))
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._entries))
@@ -0,0 +1,113 @@
+"""Bulk conversion of phrases given as packed arrays of token ids.
+
+Each language numbers its words: id i is vocabulary(lang)[i].  A batch is
+one flat sequence of ids holding every phrase back to back, plus offsets
+with one more entry than there are phrases; phrase i is
+ids[offsets[i]:offsets[i + 1]].  Lists, array.array and NumPy arrays are
+all accepted.
+
+    ids, offsets = encode(["twenty five", "two point five"])
+    values, errors = w2n_columnar(ids, offsets)
+    # values == [25, 2.5], errors == bytearray(b'\x00\x00')
+"""
+from array import array
+
+from .base import get_language
+from .core import INVALID_WORD, EXACT_MODES
+
+# Language -> (words, tokens), built on the language's first use
+_tables = {}
+
+
+def _table(language):
+    table = _tables.get(language)
+    if table is None:
+        # vocabulary words in sorted order, then the decimal word and the
+        # conjunction; the decimal word maps to None as it does in scan
+        words = tuple(sorted(language.vocab)) + (language.decimal_word,
+                                                 language.conjunction)
+        tokens = [language.vocab[word] for word in words[:-2]] + [None]
+        table = _tables[language] = (words, tokens)
+    return table
+
+
+def vocabulary(lang='en'):
+    """Return the words of lang in token-id order."""
+    return _table(get_language(lang))[0]
+
+
+def encode(texts, lang='en'):
+    """Return (ids, offsets) arrays for texts, mostly for tests and tools.
+
+    Raises ValueError for a word that is not in vocabulary(lang).
+    """
+    language = get_language(lang)
+    words = _table(language)[0]
+    word_ids = {word: i for i, word in enumerate(words)}
+    ids = array('l')
+    offsets = array('q', [0])
+    for text in texts:
+        for word in language.split(text):
+            try:
+                ids.append(word_ids[word])
+            except KeyError:
+                raise ValueError("Invalid number word: "
+                                 "{0!r} in {1}".format(word, text))
+        offsets.append(len(ids))
+    return ids, offsets
+
+
+def _as_list(values):
+    # array.array and NumPy arrays convert to plain ints in one call
+    tolist = getattr(values, 'tolist', None)
+    return tolist() if tolist is not None else list(values)
+
+
+def w2n_columnar(ids, offsets, lang='en', exact=None):
+    """Convert every phrase of a packed id batch.
+
+    Return (values, errors): values is a list with one number per phrase
+    (None where it failed) and errors a bytearray holding each phrase's
+    core status code, so errors[i] is 0 (core.OK) exactly when phrase i
+    converted.  Conjunction ids after the first word are ignored, as text
+    conversion drops the conjunction after a separator; a leading one and
+    ids outside the vocabulary fail with core.INVALID_WORD.  Each distinct
+    phrase in the batch is only converted once.
+    """
+    if exact is not None and exact not in EXACT_MODES:
+        raise ValueError("Invalid exact mode: {0}".format(exact))
+    language = get_language(lang)
+    tokens = _table(language)[1]
+    conjunction_id = len(tokens)
+    ids = _as_list(ids)
+    offsets = _as_list(offsets)
+    count = max(len(offsets) - 1, 0)
+    values = [None] * count
+    errors = bytearray(count)
+    # Out-of-range ids are rare, so only look for them per phrase when
+    # the batch has any
+    in_range = not ids or (min(ids) >= 0 and max(ids) <= conjunction_id)
+    scan_tokens = language.scan_tokens
+    complete = language.complete
+    # Phrases repeat a lot in real batches; each distinct one is only
+    # converted once
+    seen = {}
+    for i in range(count):
+        phrase = tuple(ids[offsets[i]:offsets[i + 1]])
+        result = seen.get(phrase)
+        if result is None:
+            words = phrase
+            if conjunction_id in words:
+                words = [id for id in words if id != conjunction_id]
+            if phrase and phrase[0] == conjunction_id:
+                result = None, INVALID_WORD
+            elif not in_range and words and (min(words) < 0 or
+                                             max(words) >= conjunction_id):
+                result = None, INVALID_WORD
+            else:
+                value, status, _ = complete(
+                    scan_tokens([tokens[id] for id in words]), exact)
+                result = value, status
+            seen[phrase] = result
+        values[i], errors[i] = result
+    return values, errors
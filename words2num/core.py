@@ -1,5 +1,11 @@
 """Commonly used tools
 """
+from collections import namedtuple
+from collections.abc import MutableMapping
+from decimal import Decimal
+from fractions import Fraction
+from itertools import islice
+import unicodedata
 
 
 class NumberParseException(Exception):
@@ -7,9 +13,339 @@ class NumberParseException(Exception):
         Exception.__init__(self, msg)
 
 
+_POWERS_OF_TEN = [10 ** exp for exp in range(64)]
+
+
+def power_of_ten(exp):
+    """Return 10 ** exp from a cache that grows as needed."""
+    while exp >= len(_POWERS_OF_TEN):
+        _POWERS_OF_TEN.append(_POWERS_OF_TEN[-1] * 10)
+    return _POWERS_OF_TEN[exp]
+
+
+# placevalue of every integer below 1000, for the validation fast path
+SMALL_PLACEVALUES = bytes(len(str(n)) - 1 for n in range(1000))
+
+
 def placevalue(n, base=10):
-    exp = 0
-    while n >= base:
+    """Return the exponent of the leading digit of n, using exact integer
+    arithmetic (e.g. 0 for 9, 2 for 100, 303 for a centillion).
+    """
+    n = int(n)
+    if n < base:
+        return 0
+    if base != 10:
+        exp = 0
+        while n >= base:
+            exp += 1
+            n //= base
+        return exp
+    # 1233 / 4096 is just below log10(2), so this never overestimates
+    exp = ((n.bit_length() - 1) * 1233) >> 12
+    while n >= power_of_ten(exp + 1):
         exp += 1
-        n /= 10
     return exp
+
+
+class LazyRegistry(MutableMapping):
+    """Mapping whose string values are loaded on first access.
+
+    Each string value is passed to load and replaced by the result; any
+    other value is stored and returned as is.
+    """
+
+    def __init__(self, entries, load):
+        self._entries = dict(entries)
+        self._load = load
+
+    def __getitem__(self, key):
+        value = self._entries[key]
+        if isinstance(value, str):
+            value = self._entries[key] = self._load(value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._entries[key] = value
+
+    def __delitem__(self, key):
+        del self._entries[key]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def loaded_items(self):
+        """Return the (key, value) pairs that are loaded, loading nothing."""
+        return [(key, value) for key, value in self._entries.items()
+                if not isinstance(value, str)]
+
+
+# A vocabulary entry; placevalue is computed once when the vocabulary loads
+Token = namedtuple('Token', ['value', 'label', 'placevalue'])
+
+
+def build_vocab(words):
+    """Turn {word: (value, label)} into {word: Token}."""
+    return {word: Token(value, label, placevalue(value))
+            for word, (value, label) in words.items()}
+
+
+def fold_accents(word):
+    """Strip diacritics, e.g. 'dieciséis' -> 'dieciseis'."""
+    decomposed = unicodedata.normalize('NFKD', word)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def build_fuzzy_vocab(vocab, variants):
+    """Extend vocab with accent-folded words and known misspellings.
+
+    variants maps a misspelling to the vocab word it stands for.  Exact
+    words always win over folded or misspelled ones, so every variant is
+    resolved with a single dict lookup.
+    """
+    fuzzy = {}
+    for variant, word in variants.items():
+        fuzzy[variant] = fuzzy[fold_accents(variant)] = vocab[word]
+    for word, token in vocab.items():
+        fuzzy[fold_accents(word)] = token
+    fuzzy.update(vocab)
+    return fuzzy
+
+
+def first_words(vocab, labels):
+    """Return {value: word} for the vocab words with one of labels, keeping
+    the first word listed for each value.
+    """
+    words = {}
+    for word, token in vocab.items():
+        if token.label in labels:
+            words.setdefault(token.value, word)
+    return words
+
+
+def spell_integer(n, scales, spell_group, spell_scale):
+    """Spell n >= 1 group by group, largest scale first.
+
+    scales holds the scale values (1000, 10 ** 6, ...).  spell_group(m)
+    spells 1 <= m < 1000 and spell_scale(count, scale, first) spells
+    count times scale, first being True for the leading group.  Raises
+    ValueError if a group would need 1000 or more of one scale, as between
+    vigintillion and centillion.
+    """
+    words = []
+    for scale in scales:
+        count, n = divmod(n, scale)
+        if count >= 1000:
+            raise ValueError("No words for {0} times 10 ** {1}".format(
+                count, placevalue(scale)))
+        if count:
+            words.append(spell_scale(count, scale, not words))
+    if n:
+        words.append(spell_group(n))
+    return ' '.join(words)
+
+
+EXACT_MODES = ('decimal', 'fraction')
+
+
+def decimal_digits(tokens, start=0, stop=None):
+    """Return decimal tokens[start:stop] as one integer and the number of
+    digits.
+    """
+    if stop is None:
+        stop = len(tokens)
+    digits = 0
+    for token in islice(tokens, start, stop):
+        if token.label not in ('D', 'Z'):
+            raise NumberParseException("Invalid sequence after decimal "
+                                       "point")
+        digits = digits * 10 + token.value
+    return digits, stop - start
+
+
+def exact_number(value, places, exact):
+    """Return value * 10 ** -places exactly, as a Decimal or a Fraction."""
+    if exact == 'decimal':
+        sign, digits, exponent = Decimal(value).as_tuple()
+        return Decimal((sign, digits, exponent - places))
+    if exact == 'fraction':
+        return Fraction(value, 10 ** places)
+    raise ValueError("Invalid exact mode: {0}".format(exact))
+
+
+def float_number(value, digits, places, multiplier):
+    """Return (value + digits * 10 ** -places) * multiplier, a float when
+    there are decimal places, or None if that float would overflow.
+    """
+    if places:
+        value += digits / 10 ** places
+    try:
+        value *= multiplier
+    except OverflowError:
+        return None
+    if value == _INF:
+        return None
+    return value
+
+
+_INF = float('inf')
+
+
+# FST states and token labels share one alphabet; 'S' is the start state
+# and 'F' the final label.
+LABELS = 'SDTMHXZAF'
+LABEL_INDEX = {label: i for i, label in enumerate(LABELS)}
+START = LABEL_INDEX['S']
+# Token fed to an FST to read out its final value
+END = Token(None, 'F', 0)
+
+# Edge operations, encoded as small integers; 0 marks a missing edge.
+INVALID, ZERO, ADD, MUL, MUL_HUNDRED, MUL_HUNDRED_AND_ADD, RET = range(7)
+
+# Returned by FST.transition for a token with no edge from the current state
+REJECTED = Token(None, None, None)
+
+
+def compile_transitions(edges):
+    """Compile {(state, label): op} into a flat, immutable transition table.
+
+    The operation for an edge is found at state * len(LABELS) + label.
+    """
+    table = bytearray(len(LABELS) ** 2)
+    for (state, label), op in edges.items():
+        table[LABEL_INDEX[state] * len(LABELS) + LABEL_INDEX[label]] = op
+    return bytes(table)
+
+
+class FST(object):
+    """Number state machine driven by a compiled transition table.
+
+    Subclasses set `transitions` to the output of compile_transitions; the
+    per-conversion state is only the running value and the state index.
+    transition returns REJECTED, leaving the state unchanged, for a token
+    the machine has no edge for.
+    """
+    __slots__ = ('value', 'state')
+    transitions = bytes(len(LABELS) ** 2)
+
+    def __init__(self):
+        self.value = 0
+        self.state = START
+
+    def transition(self, token):
+        n, label, _ = token
+        label_index = LABEL_INDEX[label]
+        op = self.transitions[self.state * len(LABELS) + label_index]
+        if op == INVALID:
+            return REJECTED
+        self.state = label_index
+        if op == ADD:
+            self.value += n
+        elif op == MUL:
+            output = self.value * n
+            self.value = 0
+            return output
+        elif op == RET:
+            return self.value
+        elif op == MUL_HUNDRED:
+            assert n == 100
+            self.value *= n
+        elif op == MUL_HUNDRED_AND_ADD:
+            self.value *= 100
+            self.value += n
+        elif op == ZERO:
+            assert n == 0
+            self.value = n
+
+    def accepts(self, label):
+        """Return True if the machine has an edge for label."""
+        return self.transitions[self.state * len(LABELS) +
+                                LABEL_INDEX[label]] != INVALID
+
+
+# Status codes of the non-raising conversion path; OK is 0 so any failure
+# is truthy.
+STATUS_NAMES = ('OK', 'INVALID_WORD', 'NO_TOKENS', 'REPEATED_DECIMAL',
+                'EMPTY_DECIMAL', 'INVALID_DECIMAL', 'INVALID_STATE',
+                'INVALID_SEQUENCE', 'OVERFLOW')
+(OK, INVALID_WORD, NO_TOKENS, REPEATED_DECIMAL, EMPTY_DECIMAL,
+ INVALID_DECIMAL, INVALID_STATE, INVALID_SEQUENCE,
+ OVERFLOW) = range(len(STATUS_NAMES))
+
+# Exception type and message template for each failure status; messages
+# are only formatted when an error is raised or read.
+STATUS_ERRORS = {
+    INVALID_WORD: (ValueError, "Invalid number word: {word!r} in {text}"),
+    NO_TOKENS: (ValueError, "No valid tokens in {text}"),
+    REPEATED_DECIMAL: (ValueError, "Invalid decimal word {word!r}"),
+    EMPTY_DECIMAL: (ValueError, "Invalid sequence: no tokens following "
+                                "{word!r}"),
+    INVALID_DECIMAL: (NumberParseException, "Invalid sequence after decimal "
+                                            "point at {word!r} in {text}"),
+    INVALID_STATE: (NumberParseException, "Invalid number state at {word!r} "
+                                          "in {text}"),
+    INVALID_SEQUENCE: (NumberParseException, "Invalid sequence at {word!r} "
+                                             "in {text}"),
+    OVERFLOW: (ValueError, "Number too large for a float in {text}; use "
+                           "exact='decimal'"),
+}
+
+
+class ParseResult(namedtuple('ParseResult',
+                             ['value', 'status', 'index', 'text',
+                              'language'])):
+    """Outcome of a non-raising conversion.
+
+    status is OK or one of the failure codes above and index is the
+    position of the offending word (None when no single word is at fault).
+    The error message is only built when message or error() is used.
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.status == OK
+
+    @property
+    def message(self):
+        if self.status == OK:
+            return None
+        return str(self.error())
+
+    def error(self):
+        """Return the exception w2n would have raised, or None."""
+        if self.status == OK:
+            return None
+        return self.language.error(self.status, self.index, self.text)
+
+
+class ParsedPhrase(list):
+    """A scanned phrase: the shared vocabulary Token of each word, None for
+    the decimal word, plus where each part of the phrase starts.
+
+    The integer part is phrase[:int_end], the decimal digits
+    phrase[decimal_index + 1:mul_start] and the trailing multipliers
+    phrase[mul_start:], so no list is kept per part.  status and index are
+    as in ParseResult.  Being the token list itself, a phrase is a single
+    object with no per-word allocations.
+    """
+    __slots__ = ('status', 'index', 'decimal_index', 'mul_start')
+
+    def close(self, status, index, decimal_index, mul_start):
+        """Record how the scan ended and return the phrase."""
+        self.status = status
+        self.index = index
+        self.decimal_index = decimal_index
+        self.mul_start = mul_start
+        return self
+
+    @property
+    def int_end(self):
+        if self.decimal_index is None:
+            return self.mul_start
+        return self.decimal_index
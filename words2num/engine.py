@@ -0,0 +1,381 @@
+"""Conversion engine shared by every language.
+
+A language is defined purely by data: its vocabulary, the FST edges between
+token labels, the decimal word and the conjunction dropped between words.
+"""
+from __future__ import division
+from itertools import islice
+from operator import length_hint
+
+from .core import NumberParseException, placevalue, compile_transitions
+from .core import build_vocab, build_fuzzy_vocab, END, FST
+from .core import decimal_digits, exact_number, float_number
+from .core import ParseResult, ParsedPhrase, STATUS_ERRORS
+from .core import OK, INVALID_WORD, NO_TOKENS
+from .core import REPEATED_DECIMAL, EMPTY_DECIMAL, INVALID_DECIMAL
+from .core import INVALID_STATE, INVALID_SEQUENCE, OVERFLOW, REJECTED
+from .core import LABELS, LABEL_INDEX, START, INVALID, ADD, MUL, MUL_HUNDRED
+from .core import MUL_HUNDRED_AND_ADD, ZERO, SMALL_PLACEVALUES
+from .core import power_of_ten
+
+END_INDEX = LABEL_INDEX[END.label]
+
+
+class Language(object):
+    """A locale's grammar together with the engine that evaluates it.
+
+    vocab maps each word to a (value, label) pair and edges maps each
+    (state, label) pair to an edge operation from core (ADD, MUL, ...).
+    variants maps known misspellings to vocab words for fuzzy lookups.
+    """
+
+    def __init__(self, vocab, edges, decimal_word, conjunction,
+                 variants=None):
+        self.vocab = build_vocab(vocab)
+        self.variants = dict(variants or {})
+        self.fuzzy_vocab = build_fuzzy_vocab(self.vocab, self.variants)
+        self.transitions = compile_transitions(edges)
+        self.decimal_word = decimal_word
+        self.conjunction = conjunction
+        self._link()
+
+    def _link(self):
+        """Derive the FST class from the grammar."""
+        self.fst_class = type('FST', (FST,), {
+            '__slots__': (),
+            'transitions': self.transitions,
+        })
+
+    # Only the compiled grammar is pickled; see artifact.py
+    _STATE = ('vocab', 'variants', 'fuzzy_vocab', 'transitions',
+              'decimal_word', 'conjunction')
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self._STATE)
+
+    def __setstate__(self, state):
+        for name, value in zip(self._STATE, state):
+            setattr(self, name, value)
+        self._link()
+
+    def split(self, text):
+        """Return the lowercased words of text.
+
+        Words are separated by whitespace, commas and hyphens, and the
+        conjunction is dropped from the start of any word that follows a
+        separator ("hundred and two" -> hundred, two).
+        """
+        text = text.lower()
+        words = text.replace(',', ' ').replace('-', ' ').split()
+        conjunction = self.conjunction
+        if conjunction and conjunction in text:
+            # Rejoin on single spaces so that the conjunction after every
+            # separator goes in one replace; the first word only follows a
+            # separator if text starts with one
+            lead = ' ' if text[0].isspace() or text[0] in ',-' else ''
+            words = (lead + ' '.join(words)).replace(
+                ' ' + conjunction, ' ').split()
+        return words
+
+    def scan(self, text, vocab=None):
+        """Tokenize text without raising.
+
+        Return a core.ParsedPhrase; its index is the position of the
+        offending word when its status is not OK.  Trailing multipliers
+        are the longest suffix of words that are each a hundred or greater
+        and at least as large as every word before them (e.g. million in
+        "one thousand five hundred million"); the first word never counts.
+        """
+        if vocab is None:
+            vocab = self.vocab
+        decimal_word = self.decimal_word
+        tokens = ParsedPhrase()
+        decimal_index = None
+        mul_start = 0
+        max_placevalue = 0
+        for word in self.split(text):
+            if word == decimal_word:
+                if decimal_index is not None:
+                    return tokens.close(REPEATED_DECIMAL, len(tokens),
+                                        decimal_index, mul_start)
+                decimal_index = len(tokens)
+                tokens.append(None)
+                mul_start = len(tokens)
+                continue
+            try:
+                token = vocab[word]
+            except KeyError:
+                return tokens.close(INVALID_WORD, len(tokens), decimal_index,
+                                    mul_start)
+            pv = token.placevalue
+            if not tokens or pv <= 1 or pv < max_placevalue:
+                mul_start = len(tokens) + 1
+            if pv > max_placevalue:
+                max_placevalue = pv
+            tokens.append(token)
+        return self._close(tokens, decimal_index, mul_start)
+
+    def scan_tokens(self, tokens):
+        """Like scan, for a list of tokens (None for the decimal word)
+        instead of text.
+        """
+        if not isinstance(tokens, ParsedPhrase):
+            tokens = ParsedPhrase(tokens)
+        decimal_index = None
+        mul_start = 0
+        max_placevalue = 0
+        for index, token in enumerate(tokens):
+            if token is None:
+                if decimal_index is not None:
+                    return tokens.close(REPEATED_DECIMAL, index,
+                                        decimal_index, mul_start)
+                decimal_index = index
+                mul_start = index + 1
+                continue
+            pv = token.placevalue
+            if not index or pv <= 1 or pv < max_placevalue:
+                mul_start = index + 1
+            if pv > max_placevalue:
+                max_placevalue = pv
+        return self._close(tokens, decimal_index, mul_start)
+
+    @staticmethod
+    def _close(tokens, decimal_index, mul_start):
+        """Finish a scan that read every word."""
+        if not tokens:
+            return tokens.close(NO_TOKENS, None, decimal_index, mul_start)
+        if decimal_index is not None and decimal_index + 1 == mul_start:
+            return tokens.close(EMPTY_DECIMAL, decimal_index, decimal_index,
+                                mul_start)
+        return tokens.close(OK, None, decimal_index, mul_start)
+
+    def tokenize(self, text, vocab=None):
+        """Split text into integer, decimal and trailing multiplier tokens.
+        """
+        tokens = self.scan(text, vocab)
+        if tokens.status:
+            raise self.error(tokens.status, tokens.index, text)
+        decimal_index = tokens.decimal_index
+        mul_start = tokens.mul_start
+        if decimal_index is None:
+            return tokens[:mul_start], [], tokens[mul_start:]
+        return (tokens[:decimal_index], tokens[decimal_index + 1:mul_start],
+                tokens[mul_start:])
+
+    def error(self, status, index, text):
+        """Return the exception for a failed status, formatting its message.
+        """
+        error_class, template = STATUS_ERRORS[status]
+        word = None
+        if index is not None:
+            word = self.split(text)[index]
+        return error_class(template.format(word=word, text=text))
+
+    def try_compute(self, tokens, stop=None):
+        """Compute the value of tokens[:stop] without raising.
+
+        Return (value, status, index), where index is the position in
+        tokens of the word at fault.
+        """
+        transition = self.fst_class().transition
+        total = 0
+        last_placevalue = None
+        # On failure the index is recovered from the iterator's remaining
+        # length, so the loop itself does no counting
+        if stop is not None and stop < len(tokens):
+            tokens = tokens[:stop]
+        remaining = iter(tokens)
+        for token in remaining:
+            out = transition(token)
+            if out:
+                if out is REJECTED:
+                    return None, INVALID_STATE, \
+                        len(tokens) - length_hint(remaining) - 1
+                out_placevalue = placevalue(out)
+                if last_placevalue and last_placevalue <= out_placevalue:
+                    return None, INVALID_SEQUENCE, \
+                        len(tokens) - length_hint(remaining) - 1
+                total += out
+                last_placevalue = out_placevalue
+        out = transition(END)
+        # Faults found at the end are blamed on the last word
+        last = len(tokens) - 1 if tokens else None
+        if out is REJECTED:
+            return None, INVALID_STATE, last
+        if last_placevalue and last_placevalue <= placevalue(out):
+            return None, INVALID_SEQUENCE, last
+        return total + out, OK, None
+
+    def check_tokens(self, tokens, stop=None):
+        """Validate tokens[:stop] as try_compute does, without computing a
+        value.
+
+        Return (status, index).  Only the state transitions and placevalue
+        ordering are checked: multipliers are powers of ten, so an output's
+        placevalue is found by addition and large values are never
+        multiplied out.
+        """
+        transitions = self.transitions
+        state = START
+        value = 0
+        last_placevalue = None
+        if stop is None:
+            stop = len(tokens)
+        for index, (n, label, pv) in enumerate(islice(tokens, stop)):
+            label_index = LABEL_INDEX[label]
+            op = transitions[state * len(LABELS) + label_index]
+            state = label_index
+            if op == ADD:
+                value += n
+            elif op == MUL:
+                if not value:
+                    continue
+                if n == power_of_ten(pv):
+                    out_placevalue = pv + (SMALL_PLACEVALUES[value]
+                                           if value < 1000
+                                           else placevalue(value))
+                else:
+                    out_placevalue = placevalue(value * n)
+                value = 0
+                if last_placevalue and last_placevalue <= out_placevalue:
+                    return INVALID_SEQUENCE, index
+                last_placevalue = out_placevalue
+            elif op == MUL_HUNDRED:
+                value *= 100
+            elif op == MUL_HUNDRED_AND_ADD:
+                value = value * 100 + n
+            elif op == ZERO:
+                value = 0
+            else:
+                return INVALID_STATE, index
+        # Faults found at the end are blamed on the last word
+        last = stop - 1 if stop else None
+        if transitions[state * len(LABELS) + END_INDEX] == INVALID:
+            return INVALID_STATE, last
+        if value and last_placevalue and last_placevalue <= placevalue(value):
+            return INVALID_SEQUENCE, last
+        return OK, None
+
+    def compute(self, tokens):
+        """Compute the value of given tokens, or of the integer part of a
+        core.ParsedPhrase.
+        """
+        if isinstance(tokens, ParsedPhrase):
+            value, status, index = self.try_compute(tokens, tokens.int_end)
+        else:
+            value, status, index = self.try_compute(tokens)
+        if status:
+            raise NumberParseException("Invalid sequence at token "
+                                       "{0}".format(index))
+        return value
+
+    @staticmethod
+    def compute_multipliers(tokens):
+        """
+        Determine the multiplier based on the tokens at the end of
+        a number (e.g. million from "one thousand five hundred million").
+        tokens may also be a core.ParsedPhrase.
+        """
+        if isinstance(tokens, ParsedPhrase):
+            tokens = tokens[tokens.mul_start:]
+        total = 1
+        for token in tokens:
+            total *= token.value
+        return total
+
+    @staticmethod
+    def compute_decimal(tokens, exact=None):
+        """Compute value of decimal tokens.
+
+        The digits are accumulated as one integer and scaled once; exact
+        may be 'decimal' or 'fraction' to get an exact result instead of a
+        float.  tokens may also be a core.ParsedPhrase.
+        """
+        if isinstance(tokens, ParsedPhrase):
+            if tokens.decimal_index is None:
+                return 0
+            digits, places = decimal_digits(tokens,
+                                            tokens.decimal_index + 1,
+                                            tokens.mul_start)
+        elif not tokens:
+            return 0
+        else:
+            digits, places = decimal_digits(tokens)
+        if not places:
+            return 0
+        if exact is None:
+            return digits / 10 ** places
+        return exact_number(digits, places, exact)
+
+    def _evaluate(self, text, exact, fuzzy):
+        """Return (value, status, index) for text; see try_evaluate."""
+        return self.complete(self.scan(
+            text, self.fuzzy_vocab if fuzzy else self.vocab), exact)
+
+    def complete(self, phrase, exact=None):
+        """Return (value, status, index) for a core.ParsedPhrase from scan
+        or scan_phrase.
+        """
+        if phrase.status:
+            return None, phrase.status, phrase.index
+        decimal_index = phrase.decimal_index
+        mul_start = phrase.mul_start
+        if decimal_index is None:
+            value, status, index = self.try_compute(phrase, mul_start)
+            digits = places = 0
+        else:
+            value, status, index = self.try_compute(phrase, decimal_index)
+            if not status:
+                try:
+                    digits, places = decimal_digits(
+                        phrase, decimal_index + 1, mul_start)
+                except NumberParseException:
+                    status = INVALID_DECIMAL
+                    index = decimal_index + 1
+                    while phrase[index].label in ('D', 'Z'):
+                        index += 1
+        if status:
+            return None, status, index
+        multiplier = 1
+        if mul_start < len(phrase):
+            multiplier = self.compute_multipliers(phrase[mul_start:])
+        if exact is not None:
+            return exact_number((value * 10 ** places + digits) * multiplier,
+                                places, exact), OK, None
+        value = float_number(value, digits, places, multiplier)
+        if value is None:
+            return None, OVERFLOW, None
+        return value, OK, None
+
+    def check(self, text, fuzzy=False):
+        """Return (status, index) for text as try_evaluate would, without
+        computing its value.
+        """
+        phrase = self.scan(text, self.fuzzy_vocab if fuzzy else self.vocab)
+        if phrase.status:
+            return phrase.status, phrase.index
+        decimal_index = phrase.decimal_index
+        if decimal_index is None:
+            return self.check_tokens(phrase, phrase.mul_start)
+        status, index = self.check_tokens(phrase, decimal_index)
+        if status:
+            return status, index
+        for index in range(decimal_index + 1, phrase.mul_start):
+            if phrase[index].label not in ('D', 'Z'):
+                return INVALID_DECIMAL, index
+        return OK, None
+
+    def try_evaluate(self, text, exact=None, fuzzy=False):
+        """Convert text without raising on invalid input.
+
+        Return a core.ParseResult; its status is OK on success and its
+        index points at the offending word otherwise.
+        """
+        value, status, index = self._evaluate(text, exact, fuzzy)
+        return ParseResult(value, status, index, text, self)
+
+    def evaluate(self, text, exact=None, fuzzy=False):
+        value, status, index = self._evaluate(text, exact, fuzzy)
+        if status:
+            raise self.error(status, index, text)
+        return value
@@ -0,0 +1,99 @@
+"""Find and replace number phrases in running text.
+"""
+import json
+import re
+
+from .base import get_language
+from .parser import Parser
+
+
+WORD = re.compile(r"\w+")
+# Text allowed between two words of the same number phrase
+GAP = re.compile(r"[\s,\-]+")
+
+
+def find_numbers(text, lang='en'):
+    """Yield (start, end, value) for each number phrase in text.
+
+    Text is scanned left to right and each phrase is the longest run of
+    words, starting at the leftmost possible word, that parses as a number.
+    A lone 'a' is not reported as a number, and phrases too large for a
+    float value are skipped.
+    """
+    language = get_language(lang)
+    parser = Parser(language)
+    words = [(m.start(), m.end(), m.group().lower())
+             for m in WORD.finditer(text)]
+    i = 0
+    while i < len(words):
+        if words[i][2] == language.conjunction:
+            i += 1
+            continue
+        parser.reset()
+        last = None
+        j = i
+        while j < len(words):
+            start, end, word = words[j]
+            if j > i and not GAP.fullmatch(text, words[j - 1][1], start):
+                break
+            if word == language.conjunction and j > i:
+                j += 1
+                continue
+            if not parser.feed(word):
+                break
+            if parser.is_complete():
+                last = j
+                try:
+                    value = parser.value_so_far()
+                except ValueError:
+                    value = None
+            j += 1
+        if last is None or (last == i and
+                            language.vocab[words[i][2]].label == 'A'):
+            i += 1
+            continue
+        if value is not None:
+            yield words[i][0], words[last][1], value
+        i = last + 1
+
+
+def replace_numbers(text, lang='en'):
+    """Return text with every number phrase replaced by its digits."""
+    parts = []
+    pos = 0
+    for start, end, value in find_numbers(text, lang):
+        parts.append(text[pos:start])
+        parts.append(str(value))
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def replace_lines(lines, lang='en', field=None, on_invalid=None):
+    """Lazily yield each line of lines with its number phrases replaced.
+
+    With field set, each line is a JSON record whose field is rewritten;
+    records without the field pass through unchanged, as do lines that are
+    not JSON objects, after calling on_invalid(line_number, line) if given.
+    Only one line is held in memory at a time.
+    """
+    for number, line in enumerate(lines, 1):
+        if field is None:
+            yield replace_numbers(line, lang)
+            continue
+        if not line.strip():
+            yield line
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            if on_invalid is not None:
+                on_invalid(number, line)
+            yield line
+            continue
+        text = record.get(field)
+        if isinstance(text, str):
+            record[field] = replace_numbers(text, lang)
+        yield json.dumps(record, ensure_ascii=False) + '\n'
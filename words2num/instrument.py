@@ -0,0 +1,195 @@
+"""Opt-in per-stage timing and counters for conversions.
+
+    from words2num import instrument
+    instrument.enable(callback=None)
+    ...
+    instrument.snapshot()
+    instrument.disable()
+
+While enabled, every conversion through Language.evaluate or
+try_evaluate (w2n, w2n_try, w2n_batch, w2n_parallel) records the
+nanoseconds spent in each stage, its token and FST transition counts and
+its outcome, per language.  enable() swaps an instrumented conversion
+method into engine.Language, and timing wrappers around the stages it
+calls, and disable() swaps the originals back, so there is no overhead at
+all while disabled.  is_number_phrase (Language.check), w2n_columnar
+(which calls Language.complete directly) and find_numbers (which feeds a
+Parser) are not instrumented.
+
+Stages are 'tokenize' (word split, vocabulary lookup and the trailing
+multiplier placevalue scan, which run as one pass), 'compute' (the FST and
+placevalue ordering checks), 'decimal' and 'multipliers' (the multiplier
+product and final value).  Counters are per process; pool workers started
+by w2n_parallel keep their own.
+"""
+from threading import Lock, local
+from time import perf_counter_ns
+
+from . import engine
+from .base import LANGUAGES, CONVERTER_CLASSES
+from .core import STATUS_NAMES, OK, OVERFLOW
+from .engine import Language
+
+STAGES = ('tokenize', 'compute', 'decimal', 'multipliers')
+
+_original = Language._evaluate
+_original_try_compute = Language.try_compute
+_original_decimal_digits = engine.decimal_digits
+_lock = Lock()
+# stage timings and FST transitions of the conversion running on a thread
+_current = local()
+# Language -> counters, created on the language's first conversion
+_stats = {}
+# Language -> code reported to the callback
+_names = {}
+_callback = None
+
+
+def _new_stats():
+    return {
+        'calls': 0,
+        'tokens': 0,
+        'transitions': 0,
+        'ns': dict.fromkeys(STAGES, 0),
+        'statuses': {},
+    }
+
+
+def _record(language, stage_ns, tokens, transitions, status):
+    with _lock:
+        stats = _stats.get(language)
+        if stats is None:
+            stats = _stats[language] = _new_stats()
+        stats['calls'] += 1
+        stats['tokens'] += tokens
+        stats['transitions'] += transitions
+        totals = stats['ns']
+        for stage, ns in stage_ns.items():
+            totals[stage] += ns
+        statuses = stats['statuses']
+        statuses[STATUS_NAMES[status]] = \
+            statuses.get(STATUS_NAMES[status], 0) + 1
+    if _callback is not None:
+        lang = _names.get(language)
+        if lang is None:
+            lang = _names[language] = _name(language)
+        _callback({
+            'lang': lang,
+            'status': STATUS_NAMES[status],
+            'tokens': tokens,
+            'transitions': transitions,
+            'ns': stage_ns,
+        })
+
+
+def _evaluate(self, text, exact, fuzzy):
+    """Language._evaluate, timing scan and the stages of complete."""
+    stage_ns = _current.stage_ns = {}
+    _current.transitions = 0
+    try:
+        start = perf_counter_ns()
+        phrase = self.scan(text, self.fuzzy_vocab if fuzzy else self.vocab)
+        now = perf_counter_ns()
+        value, status, index = self.complete(phrase, exact)
+        end = perf_counter_ns()
+    finally:
+        _current.stage_ns = None
+    stage_ns['tokenize'] = now - start
+    if status in (OK, OVERFLOW):
+        # whatever complete did after the integer and decimal parts
+        parts = stage_ns.get('compute', 0) + stage_ns.get('decimal', 0)
+        stage_ns['multipliers'] = end - now - parts
+    _record(self, stage_ns, len(phrase), _current.transitions, status)
+    return value, status, index
+
+
+def _try_compute(self, tokens, stop=None):
+    stage_ns = getattr(_current, 'stage_ns', None)
+    if stage_ns is None:
+        return _original_try_compute(self, tokens, stop)
+    start = perf_counter_ns()
+    result = _original_try_compute(self, tokens, stop)
+    stage_ns['compute'] = perf_counter_ns() - start
+    # the FST reads every token and then END, or stops at a fault
+    index = result[2]
+    if index is None:
+        index = len(tokens) if stop is None else min(stop, len(tokens))
+    _current.transitions = index + 1
+    return result
+
+
+def _decimal_digits(tokens, start=0, stop=None):
+    stage_ns = getattr(_current, 'stage_ns', None)
+    if stage_ns is None:
+        return _original_decimal_digits(tokens, start, stop)
+    began = perf_counter_ns()
+    try:
+        return _original_decimal_digits(tokens, start, stop)
+    finally:
+        stage_ns['decimal'] = perf_counter_ns() - began
+
+
+def _name(language):
+    """Return the shortest language code language is registered under."""
+    codes = [code for code, value in LANGUAGES.loaded_items()
+             if value is language]
+    codes += [code for code, convert in CONVERTER_CLASSES.loaded_items()
+              if getattr(convert, '__self__', None) is language]
+    if not codes:
+        return repr(language)
+    return min(codes, key=lambda code: (len(code), code))
+
+
+def enable(callback=None):
+    """Start recording conversions.
+
+    callback, if given, is called after every conversion with a dict of
+    its 'lang', 'status', 'tokens', 'transitions' and per-stage 'ns'.
+    """
+    global _callback
+    _callback = callback
+    Language.try_compute = _try_compute
+    engine.decimal_digits = _decimal_digits
+    Language._evaluate = _evaluate
+
+
+def disable():
+    """Stop recording and restore the uninstrumented conversion path."""
+    global _callback
+    Language._evaluate = _original
+    Language.try_compute = _original_try_compute
+    engine.decimal_digits = _original_decimal_digits
+    _callback = None
+
+
+def is_enabled():
+    return Language._evaluate is _evaluate
+
+
+def reset():
+    """Discard everything recorded so far."""
+    with _lock:
+        _stats.clear()
+    _names.clear()
+
+
+def snapshot():
+    """Return the counters recorded so far, keyed by language code.
+
+    Each entry holds 'calls', 'tokens', 'transitions', total nanoseconds
+    per stage under 'ns' and a count per outcome under 'statuses' (e.g.
+    'OK', 'INVALID_WORD', 'INVALID_SEQUENCE').
+    """
+    with _lock:
+        return {_name(language): _copy(stats)
+                for language, stats in _stats.items()}
+
+
+def _copy(stats):
+    return {
+        'calls': stats['calls'],
+        'tokens': stats['tokens'],
+        'transitions': stats['transitions'],
+        'ns': dict(stats['ns']),
+        'statuses': dict(stats['statuses']),
+    }
@@ -1,11 +1,11 @@
 from __future__ import division, unicode_literals, print_function
-from decimal import Decimal, localcontext
-import re
+from .core import ZERO, ADD, MUL, RET
+from .core import first_words, spell_integer
+from .engine import Language
 
-from .core import NumberParseException, placevalue
 
-
-VOCAB = {
+# word: (value, label); labels are the FST token labels from core
+WORDS = {
     'cero': (0, 'Z'),
     'uno': (1, 'D'),
     'una': (1, 'D'),
@@ -83,171 +83,114 @@ VOCAB = {
 }
 
 
-class FST:
-    def __init__(self):
-        def f_zero(self, n):
-            assert n == 0
-            self.value = n
-
-        def f_add(self, n):
-            self.value += n
-
-        def f_mul(self, n):
-            output = self.value * n
-            self.value = 0
-            return output
-
-        def f_mul_hundred(self, n):
-            assert n == 100
-            self.value *= n
-
-        def f_mul_hundred_and_add(self, n):
-            self.value *= 100
-            self.value += n
-
-        def f_ret(self, _):
-            return self.value
-
-        self.value = 0
-        self.state = 'S'
-        self.edges = {
-            ('S', 'Z'): f_zero,    # 0
-            ('S', 'D'): f_add,     # 9
-            ('S', 'T'): f_add,     # 90
-            ('S', 'M'): f_add,     # 19
-            ('S', 'H'): f_add,    # 100
-            ('S', 'F'): f_ret,     # 1
-            ('D', 'X'): f_mul,     # 9000
-            ('D', 'F'): f_ret,     # 9
-            ('T', 'D'): f_add,     # 99
-            ('T', 'X'): f_mul,     # 90000
-            ('T', 'F'): f_ret,     # 90
-            ('M', 'X'): f_mul,     # 19000
-            ('M', 'F'): f_ret,     # 19
-            ('H', 'D'): f_add,     # 909
-            ('H', 'T'): f_add,     # 990
-            ('H', 'M'): f_add,     # 919
-            ('H', 'X'): f_mul,     # 900000
-            ('H', 'F'): f_ret,     # 900
-            ('X', 'D'): f_add,     # 9009
-            ('X', 'T'): f_add,     # 9090
-            ('X', 'M'): f_add,     # 9019
-            ('X', 'H'): f_add,     # 9900
-            ('X', 'F'): f_ret,     # 9000
-            ('Z', 'F'): f_ret,     # 0
-            ('S', 'X'): f_add,      # 1000
-        }
-
-    def transition(self, token):
-        value, label = token
-        try:
-            edge_fn = self.edges[(self.state, label)]
-        except KeyError:
-            raise NumberParseException(f"Invalid number state from {self.state} to {label}")
-
-        self.state = label
-        return edge_fn(self, value)
-
-
-def compute_placevalues(tokens):
-    """Compute the placevalues for each token in the list tokens"""
-    pvs = []
-    for tok in tokens:
-        if tok == 'punto':
-            pvs.append(0)
-        else:
-            pvs.append(placevalue(VOCAB[tok][0]))
-    return pvs
-
-def tokenize(text):
-    tokens = re.split(r"[\s,\-]+(?:y)?", text.lower())
-    # Remove empty strings caused by split
-    tokens = [tok for tok in tokens if tok]
-    try:
-        # don't use generator here because we want to raise the exception
-        # here now if the word is not found in vocabulary (easier debug)
-        decimal = False
-        parsed_tokens = []
-        decimal_tokens = []
-        mul_tokens = []
-        pvs = compute_placevalues(tokens)
-        # Loop until all trailing multiplier tokens are removed and added to mul_tokens; Loop conditions:
-        # 1: The last token in the list must have the highest placevalue of any token
-        # 2: The list of tokens must be longer than one (to prevent extracting all tokens as mul_tokens)
-        # 3: The maximum placevalue must be greater than 1 (This limits our mul_tokens to "hundred" or greater)
-        while max(pvs) == pvs[-1] and len(pvs) > 1 and max(pvs) > 1:
-            mul_tokens.insert(0, VOCAB[tokens.pop()])
-            pvs.pop()
-
-        for token in tokens:
-            if token == 'punto':
-                if decimal:
-                    raise ValueError(f"Invalid decimal word '{token}'")
-                else:
-                    decimal = True
-            else:
-                if decimal:
-                    decimal_tokens.append(VOCAB[token])
-                else:
-                    parsed_tokens.append(VOCAB[token])
-    except KeyError as e:
-        raise ValueError(f"Invalid number word: {e} in {text}")
-    if decimal and not decimal_tokens:
-        raise ValueError(f"Invalid sequence: no tokens following 'point'")
-    return parsed_tokens, decimal_tokens, mul_tokens
-
-
-def compute(tokens):
-    """Compute the value of given tokens.
-    """
-    fst = FST()
-    outputs = []
-    last_placevalue = None
-    for token in tokens:
-        out = fst.transition(token)
-        if out:
-            outputs.append(out)
-            if last_placevalue and last_placevalue <= placevalue(outputs[-1]):
-                raise NumberParseException(f"Invalid sequence {outputs}")
-            last_placevalue = placevalue(outputs[-1])
-    outputs.append(fst.transition((None, 'F')))
-    if last_placevalue and last_placevalue <= placevalue(outputs[-1]):
-        raise NumberParseException(f"Invalid sequence {outputs}")
-    return sum(outputs)
-
-
-def compute_multipliers(tokens):
-    """
-    Determine the multiplier based on the tokens at the end of
-    a number (e.g. million from "one thousand five hundred million")
-    """
-    total = 1
-    for token in tokens:
-        value, label = token
-        total *= value
-    return total
-
-
-def compute_decimal(tokens):
-    """Compute value of decimal tokens."""
-    with localcontext() as ctx:
-        # Locally sets decimal precision to 15 for all computations
-        ctx.prec = 15
-        total = Decimal()
-        place = -1
-        for token in tokens:
-            value, label = token
-            if label not in ('D', 'Z'):
-                raise NumberParseException("Invalid sequence after decimal point")
-            else:
-                total += value * Decimal(10) ** Decimal(place)
-                place -= 1
-    return float(total) if tokens else 0
-
-
-def evaluate(text):
-    tokens, decimal_tokens, mul_tokens = tokenize(text)
-    if not tokens and not decimal_tokens:
-        raise ValueError(f"No valid tokens in {text}")
-
-    return (compute(tokens) + compute_decimal(decimal_tokens)) * compute_multipliers(mul_tokens)
+# Common misspellings, mostly from ASR output; words without their
+# accents are accepted as well
+VARIANTS = {
+    'sero': 'cero',
+    'sinco': 'cinco',
+    'dies': 'diez',
+    'onse': 'once',
+    'dose': 'doce',
+    'trese': 'trece',
+    'catorse': 'catorce',
+    'quinse': 'quince',
+    'veintiún': 'veintiuno',
+    'sien': 'cien',
+    'siento': 'ciento',
+    'cincocientos': 'quinientos',
+    'sietecientos': 'setecientos',
+    'nuevecientos': 'novecientos',
+    'sextillón': 'sextillon',
+}
+
+
+EDGES = {
+    ('S', 'Z'): ZERO,                # 0
+    ('S', 'D'): ADD,                 # 9
+    ('S', 'T'): ADD,                 # 90
+    ('S', 'M'): ADD,                 # 19
+    ('S', 'H'): ADD,                 # 100
+    ('S', 'F'): RET,                 # 1
+    ('D', 'X'): MUL,                 # 9000
+    ('D', 'F'): RET,                 # 9
+    ('T', 'D'): ADD,                 # 99
+    ('T', 'X'): MUL,                 # 90000
+    ('T', 'F'): RET,                 # 90
+    ('M', 'X'): MUL,                 # 19000
+    ('M', 'F'): RET,                 # 19
+    ('H', 'D'): ADD,                 # 909
+    ('H', 'T'): ADD,                 # 990
+    ('H', 'M'): ADD,                 # 919
+    ('H', 'X'): MUL,                 # 900000
+    ('H', 'F'): RET,                 # 900
+    ('X', 'D'): ADD,                 # 9009
+    ('X', 'T'): ADD,                 # 9090
+    ('X', 'M'): ADD,                 # 9019
+    ('X', 'H'): ADD,                 # 9900
+    ('X', 'F'): RET,                 # 9000
+    ('Z', 'F'): RET,                 # 0
+    ('S', 'X'): ADD,                 # 1000
+}
+
+
+LANGUAGE = Language(WORDS, EDGES, decimal_word='punto', conjunction='y',
+                    variants=VARIANTS)
+
+# Module-level API, kept for code that uses the language modules directly
+VOCAB = LANGUAGE.vocab
+FUZZY_VOCAB = LANGUAGE.fuzzy_vocab
+TRANSITIONS = LANGUAGE.transitions
+FST = LANGUAGE.fst_class
+DECIMAL_WORD = LANGUAGE.decimal_word
+CONJUNCTION = LANGUAGE.conjunction
+split = LANGUAGE.split
+tokenize = LANGUAGE.tokenize
+compute = LANGUAGE.compute
+compute_multipliers = LANGUAGE.compute_multipliers
+compute_decimal = LANGUAGE.compute_decimal
+evaluate = LANGUAGE.evaluate
+
+
+# Spelling for n2w; the first word listed for each value is used, and the
+# other scale words listed are plurals
+_ZERO = first_words(VOCAB, 'Z')[0]
+_UNITS = first_words(VOCAB, 'DMT')
+_HUNDREDS = first_words(VOCAB, 'H')
+_SCALE_WORDS = first_words(VOCAB, 'X')
+_PLURALS = {token.value: word for word, token in VOCAB.items()
+            if token.label == 'X' and word != _SCALE_WORDS[token.value]}
+_SCALES = sorted(_SCALE_WORDS, reverse=True)
+
+
+def _spell_group(n, before_scale=False):
+    hundreds, rest = divmod(n, 100)
+    words = []
+    if hundreds:
+        words.append('ciento' if hundreds == 1 and rest
+                     else _HUNDREDS[hundreds * 100])
+    if rest in _UNITS:
+        words.append(_UNITS[rest])
+    elif rest:
+        tens, ones = divmod(rest, 10)
+        words += [_UNITS[tens * 10], CONJUNCTION, _UNITS[ones]]
+    # un millón, treinta y un mil
+    if before_scale and words[-1] == 'uno':
+        words[-1] = 'un'
+    return ' '.join(words)
+
+
+def _spell_scale(count, scale, first):
+    if count == 1:
+        # mil on its own, but un mil after a larger scale
+        if scale == 1000 and first:
+            return _SCALE_WORDS[scale]
+        return 'un ' + _SCALE_WORDS[scale]
+    return (_spell_group(count, True) + ' ' +
+            _PLURALS.get(scale, _SCALE_WORDS[scale]))
+
+
+def spell(n):
+    """Return the words for an integer n >= 0."""
+    if not n:
+        return _ZERO
+    return spell_integer(n, _SCALES, _spell_group, _spell_scale)
@@ -0,0 +1,146 @@
+"""Load generator for words2num.server.
+
+    python -m words2num.loadgen [--url http://127.0.0.1:8089/ | --unix PATH]
+                                [--requests 2000] [--concurrency 8]
+                                [--batch 16] [--lang en]
+
+Sends batched conversion requests from concurrent keep-alive connections
+against a running server and prints p50/p99 latency and requests/sec as
+JSON.
+"""
+import argparse
+import http.client
+import json
+import socket
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+PHRASES = {
+    'en': ["two", "twenty five", "one hundred and two", "a thousand",
+           "sixty-eight billion, two hundred two million and two",
+           "ninety nine point nine", "one thousand five hundred million",
+           "frogess"],
+    'es': ["dos", "veinticinco", "ciento dos", "mil",
+           "sesenta y ocho billones doscientos dos millones dos",
+           "noventa y nueve punto nueve", "mil quinientos millones",
+           "sapo"],
+}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix stream socket."""
+
+    def __init__(self, path, timeout=10):
+        http.client.HTTPConnection.__init__(self, 'localhost',
+                                            timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+def percentile(ordered, fraction):
+    """Return the nearest-rank percentile of an ordered list."""
+    rank = int(round(fraction * len(ordered)))
+    index = min(len(ordered) - 1, max(0, rank - 1))
+    return ordered[index]
+
+
+def run(connect, path, body, requests, concurrency):
+    """Send requests POSTs of body; return (latencies, failures, seconds).
+
+    Requests that get no response, e.g. on a connection error, count as
+    failures, and the connection is reopened for the next one.
+    """
+    latencies = []
+    failures = [0]
+    lock = threading.Lock()
+    counts = [requests // concurrency + (i < requests % concurrency)
+              for i in range(concurrency)]
+
+    def worker(count):
+        connection = connect()
+        local = []
+        failed = 0
+        try:
+            for _ in range(count):
+                started = time.perf_counter()
+                try:
+                    connection.request('POST', path, body,
+                                       {'Content-Type': 'application/json'})
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    failed += 1
+                    continue
+                local.append(time.perf_counter() - started)
+                if response.status != 200:
+                    failed += 1
+        finally:
+            connection.close()
+        with lock:
+            latencies.extend(local)
+            failures[0] += failed
+
+    threads = [threading.Thread(target=worker, args=(count,))
+               for count in counts if count]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), failures[0], time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m words2num.loadgen',
+                                     description="Load test a running "
+                                                 "words2num.server.")
+    parser.add_argument('--url', default='http://127.0.0.1:8089/')
+    parser.add_argument('--unix', metavar='PATH',
+                        help="connect to a Unix socket instead of --url")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch', type=int, default=16,
+                        help="phrases per request")
+    parser.add_argument('--lang', default='en', choices=sorted(PHRASES))
+    args = parser.parse_args(argv)
+
+    if args.unix:
+        path = '/'
+        connect = lambda: UnixHTTPConnection(args.unix)  # noqa: E731
+    else:
+        url = urlsplit(args.url)
+        path = url.path or '/'
+        connect = lambda: http.client.HTTPConnection(  # noqa: E731
+            url.hostname, url.port or 80, timeout=10)
+    phrases = PHRASES[args.lang]
+    texts = [phrases[i % len(phrases)] for i in range(args.batch)]
+    body = json.dumps({'texts': texts, 'lang': args.lang}).encode('utf-8')
+
+    latencies, failures, elapsed = run(connect, path, body, args.requests,
+                                       args.concurrency)
+    if not latencies:
+        sys.exit("no requests completed")
+    report = {
+        'requests': args.requests,
+        'failures': failures,
+        'concurrency': args.concurrency,
+        'batch': args.batch,
+        'seconds': round(elapsed, 3),
+        'requests_per_sec': round(len(latencies) / elapsed, 1),
+        'phrases_per_sec': round(len(latencies) * args.batch / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1e3, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1e3, 3),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
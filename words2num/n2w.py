@@ -0,0 +1,85 @@
+"""Spell numbers as words, the reverse of w2n, for round-trip checks.
+
+The words come from the same vocabulary tables w2n reads, so every phrase
+n2w produces parses back to its number.  They are the parser's own forms,
+not necessarily natural language: Spanish output follows what the es
+grammar accepts, e.g. "veintiuno mil" for 21000 and "un millón un mil
+quinientos" for 1001500 where Spanish says "veintiún mil" and "un millón
+mil quinientos".  round_trip checks n2w against w2n, so it cannot find
+phrases the grammar is missing.
+
+    n2w(1234) == 'one thousand two hundred thirty-four'
+    round_trip(range(10 ** 6), 'es') == []
+"""
+from decimal import Decimal
+
+from .base import get_language, get_speller
+from .core import first_words
+
+# Language -> digit words for decimals, built on the language's first use
+_digits = {}
+
+
+def _digit_words(language):
+    words = _digits.get(language)
+    if words is None:
+        table = first_words(language.vocab, 'DZ')
+        words = _digits[language] = [table[d] for d in range(10)]
+    return words
+
+
+def n2w(number, lang='en'):
+    """Return the words for number, a non-negative int, Decimal or float.
+
+    Decimals are spelled digit by digit after the decimal word, keeping
+    trailing zeros of a Decimal.  Words are the forms w2n parses for lang,
+    which for Spanish are not always natural Spanish (see above).  Raises ValueError for negative numbers
+    and for numbers the vocabulary has no words for (e.g. 10 ** 70 in
+    English, between vigintillion and centillion).
+    """
+    spell = get_speller(lang)
+    if isinstance(number, int):
+        if number < 0:
+            raise ValueError("Invalid number: {0}".format(number))
+        return spell(number)
+    if isinstance(number, float):
+        number = Decimal(repr(number))
+    if not number.is_finite() or number < 0:
+        raise ValueError("Invalid number: {0}".format(number))
+    integer, _, fraction = '{0:f}'.format(number).partition('.')
+    words = spell(int(integer))
+    if not fraction:
+        return words
+    language = get_language(lang)
+    digits = _digit_words(language)
+    return ' '.join([words, language.decimal_word] +
+                    [digits[int(d)] for d in fraction])
+
+
+def round_trip(numbers, lang='en'):
+    """Spell each number and parse it back; return the mismatches.
+
+    Each mismatch is (number, words, result), result being the parsed
+    value or the exception parsing raised.  Non-integers are compared
+    exactly, as Decimals.  Raises ValueError like n2w for numbers that
+    can't be spelled.
+    """
+    spell = get_speller(lang)
+    language = get_language(lang)
+    evaluate = language.try_evaluate
+    failures = []
+    for number in numbers:
+        if isinstance(number, int) and number >= 0:
+            words = spell(number)
+            result = evaluate(words)
+            expected = number
+        else:
+            words = n2w(number, lang)
+            result = evaluate(words, 'decimal')
+            expected = (Decimal(repr(number)) if isinstance(number, float)
+                        else number)
+        if not result.ok:
+            failures.append((number, words, result.error()))
+        elif result.value != expected:
+            failures.append((number, words, result.value))
+    return failures
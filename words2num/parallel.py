@@ -0,0 +1,53 @@
+"""Convert large batches across a pool of worker processes.
+"""
+from itertools import islice
+
+from .base import get_converter, w2n_batch, ERROR_POLICIES
+
+
+# Per-worker settings, filled in once by _init_worker
+_worker_lang = None
+_worker_errors = None
+
+
+def _init_worker(lang, errors):
+    global _worker_lang, _worker_errors
+    # Resolve the language here so its tables are ready before any chunk
+    get_converter(lang)
+    _worker_lang = lang
+    _worker_errors = errors
+
+
+def _convert_chunk(texts):
+    return w2n_batch(texts, _worker_lang, _worker_errors)
+
+
+def _chunks(texts, chunksize):
+    texts = iter(texts)
+    chunk = list(islice(texts, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(texts, chunksize))
+
+
+def w2n_parallel(texts, lang='en', workers=None, chunksize=1000,
+                 errors='raise'):
+    """Convert texts on a process pool, returning a list in input order.
+
+    Input is sent to the workers in chunks of chunksize phrases; workers
+    defaults to the number of CPUs.  errors has the same meaning as in
+    w2n_batch.
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError("Invalid error policy: {0}".format(errors))
+    if chunksize < 1:
+        raise ValueError("Invalid chunk size: {0}".format(chunksize))
+    # fail fast on unsupported languages instead of in every worker
+    get_converter(lang)
+    # imported here to keep it out of the package import time
+    from multiprocessing import Pool
+    results = []
+    with Pool(workers, _init_worker, (lang, errors)) as pool:
+        for chunk in pool.imap(_convert_chunk, _chunks(texts, chunksize)):
+            results.extend(chunk)
+    return results
@@ -0,0 +1,215 @@
+"""Incremental number parsing, one word at a time.
+"""
+from .base import get_language
+from .core import REJECTED, placevalue, exact_number, float_number
+from .engine import Language
+
+
+class Parser(object):
+    """Parse a number phrase from words fed one at a time.
+
+    Each word advances the FST in constant time, so streaming a phrase
+    costs O(n) instead of re-running w2n on every prefix.  Words that may
+    still turn out to be trailing multipliers (million in "one thousand
+    five hundred million") are held back until a smaller word arrives or
+    the phrase ends, as in Language.scan.
+
+        parser = Parser('en')
+        for word in words:
+            if not parser.feed(word):
+                break
+        value = parser.finalize()
+
+    lang may also be an engine.Language.
+    """
+
+    def __init__(self, lang='en', fuzzy=False):
+        if isinstance(lang, Language):
+            self.language = lang
+        else:
+            self.language = get_language(lang)
+        self.vocab = (self.language.fuzzy_vocab if fuzzy
+                      else self.language.vocab)
+        self.reset()
+
+    def reset(self):
+        """Forget every word fed so far."""
+        self.fst = self.language.fst_class()
+        self.words = []
+        # sum of the FST outputs so far and the placevalue of the last one
+        self.total = 0
+        self.last_placevalue = None
+        self.int_count = 0
+        # None until the decimal word, then the digits as one integer
+        self.decimal_digits = None
+        self.decimal_places = 0
+        # held-back multiplier candidates and their product
+        self.mul_tokens = []
+        self.multiplier = 1
+        self.max_placevalue = 0
+        self.count = 0
+        self.rejected = False
+
+    def feed(self, word):
+        """Consume a word; return False if no number can contain it.
+
+        A rejected word leaves the parser as it was before the word, and
+        every later word is rejected too: finalize() the number so far and
+        start over with the rejected word.  word may also be a hyphenated
+        or comma-separated chunk such as "twenty-five".
+        """
+        if self.rejected:
+            return False
+        if word.isalpha():
+            word = word.lower()
+            if not self._feed(word):
+                self.rejected = True
+                return False
+            self.words.append(word)
+            return True
+        # chunks with separators are fed word by word, all or nothing
+        state = self._save()
+        words = self.language.split(word)
+        for part in words:
+            if not self._feed(part):
+                self._restore(state)
+                self.rejected = True
+                return False
+        self.words.extend(words)
+        return True
+
+    def _feed(self, word):
+        """Consume one word, leaving the parser unchanged if it fails."""
+        language = self.language
+        if word == language.conjunction and self.count:
+            return True
+        if word == language.decimal_word:
+            if self.decimal_digits is not None:
+                return False
+            state = self._save()
+            if not self._commit_mul():
+                self._restore(state)
+                return False
+            self.decimal_digits = 0
+            self.count += 1
+            return True
+        token = self.vocab.get(word)
+        if token is None:
+            return False
+        pv = token.placevalue
+        if not self.count or pv <= 1 or pv < self.max_placevalue:
+            state = self._save()
+            if not self._commit_mul() or not self._commit(token):
+                self._restore(state)
+                return False
+        else:
+            self.mul_tokens.append(token)
+            self.multiplier *= token.value
+        if pv > self.max_placevalue:
+            self.max_placevalue = pv
+        self.count += 1
+        return True
+
+    def _save(self):
+        fst = self.fst
+        return (fst.value, fst.state, self.total, self.last_placevalue,
+                self.int_count, self.decimal_digits, self.decimal_places,
+                list(self.mul_tokens), self.multiplier, self.max_placevalue,
+                self.count)
+
+    def _restore(self, state):
+        fst = self.fst
+        (fst.value, fst.state, self.total, self.last_placevalue,
+         self.int_count, self.decimal_digits, self.decimal_places,
+         self.mul_tokens, self.multiplier, self.max_placevalue,
+         self.count) = state
+
+    def _commit_mul(self):
+        """Feed held-back multiplier candidates to the FST as plain words."""
+        mul_tokens = self.mul_tokens
+        self.mul_tokens = []
+        self.multiplier = 1
+        for token in mul_tokens:
+            if not self._commit(token):
+                return False
+        return True
+
+    def _commit(self, token):
+        if self.decimal_digits is not None:
+            if token.label not in ('D', 'Z'):
+                return False
+            self.decimal_digits = self.decimal_digits * 10 + token.value
+            self.decimal_places += 1
+            return True
+        out = self.fst.transition(token)
+        if out is REJECTED:
+            return False
+        self.int_count += 1
+        if out:
+            out_placevalue = placevalue(out)
+            last_placevalue = self.last_placevalue
+            if last_placevalue and last_placevalue <= out_placevalue:
+                return False
+            self.total += out
+            self.last_placevalue = out_placevalue
+        return True
+
+    def _final_output(self):
+        """Return the FST's output if the phrase ended now, or None."""
+        fst = self.fst
+        if not fst.accepts('F'):
+            return None
+        out = fst.value
+        if self.last_placevalue and self.last_placevalue <= placevalue(out):
+            return None
+        return out
+
+    def is_complete(self):
+        """Return True if the words so far form a whole number."""
+        if self.decimal_digits is None:
+            if not self.int_count:
+                return False
+        elif not self.decimal_places:
+            return False
+        return self._final_output() is not None
+
+    def can_continue(self):
+        """Return False once a word has been rejected.
+
+        Any word may still be a held-back multiplier, so until then some
+        further word can always extend the phrase.
+        """
+        return not self.rejected
+
+    def value_so_far(self, exact=None):
+        """Return the value of the words so far, or None if they do not
+        form a whole number.  exact is as in w2n; like w2n, raises
+        ValueError if a decimal is too large for a float.
+        """
+        if not self.is_complete():
+            return None
+        value = self.total + self._final_output()
+        if self.decimal_digits is None:
+            value *= self.multiplier
+            return value if exact is None else exact_number(value, 0, exact)
+        digits, places = self.decimal_digits, self.decimal_places
+        if exact is None:
+            value = float_number(value, digits, places, self.multiplier)
+            if value is None:
+                raise ValueError("Number too large for a float: "
+                                 "{0!r}".format(' '.join(self.words)))
+            return value
+        return exact_number((value * 10 ** places + digits) * self.multiplier,
+                            places, exact)
+
+    def finalize(self, exact=None):
+        """Return the value of the phrase and reset the parser.
+
+        Raises ValueError if the words so far are not a whole number.
+        """
+        value = self.value_so_far(exact)
+        if value is None:
+            raise ValueError("Incomplete number: "
+                             "{0!r}".format(' '.join(self.words)))
+        self.reset()
+        return value
@@ -0,0 +1,140 @@
+"""Local JSON conversion server over HTTP or a Unix socket.
+
+    python -m words2num.server [--host 127.0.0.1] [--port 8089]
+    python -m words2num.server --unix /tmp/words2num.sock
+
+POST a JSON object to any path:
+
+    {"texts": ["twenty five", "frogess"], "lang": "en"}
+
+and get back the values and per-phrase error messages, in order:
+
+    {"results": [25, null], "errors": [null, "Invalid number word: ..."]}
+
+"lang" defaults to "en"; "exact": "decimal" or "fraction" returns exact
+values as strings.  GET returns {"status": "ok"} for health checks.
+"""
+import argparse
+import json
+import math
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .base import get_language, w2n_isolated
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately; without TCP_NODELAY each
+    # keep-alive response stalls on the client's delayed ACK
+    disable_nagle_algorithm = True
+    # set to False to log every request to stderr
+    quiet = True
+
+    def do_GET(self):
+        self._reply(200, {'status': 'ok'})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            texts = request['texts']
+            lang = request.get('lang', 'en')
+            exact = request.get('exact')
+            if not isinstance(texts, list) or not all(
+                    isinstance(text, str) for text in texts):
+                raise ValueError("'texts' must be a list of strings")
+            results = w2n_isolated(texts, lang, exact)
+        except NotImplementedError:
+            self._reply(400, {'error': "Unsupported language"})
+            return
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {'error': "Invalid request: {0}".format(e)})
+            return
+        values = []
+        errors = []
+        for result in results:
+            if isinstance(result, float) and not math.isfinite(result):
+                # JSON has no infinity
+                result = ValueError("Number too large: {0}".format(result))
+            if isinstance(result, Exception):
+                values.append(None)
+                errors.append(str(result) or type(result).__name__)
+            else:
+                if exact is not None:
+                    result = str(result)
+                values.append(result)
+                errors.append(None)
+        self._reply(200, {'results': values, 'errors': errors})
+
+    def _reply(self, status, body):
+        payload = json.dumps(body, allow_nan=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn,
+                     socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        # BaseHTTPRequestHandler expects these from HTTPServer
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+def make_server(host='127.0.0.1', port=8089, unix=None, preload=('en',)):
+    """Create a conversion server with the preload languages loaded."""
+    for lang in preload:
+        get_language(lang)
+    if unix is not None:
+        if os.path.exists(unix):
+            os.remove(unix)
+        return UnixHTTPServer(unix, ConversionHandler)
+    server = ThreadingHTTPServer((host, port), ConversionHandler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m words2num.server',
+                                     description="Serve number conversion "
+                                                 "requests as JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--unix', metavar='PATH',
+                        help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--preload', default='en,es',
+                        help="comma-separated languages to load at startup")
+    parser.add_argument('--verbose', action='store_true',
+                        help="log every request")
+    args = parser.parse_args(argv)
+
+    ConversionHandler.quiet = not args.verbose
+    server = make_server(args.host, args.port, args.unix,
+                         [lang for lang in args.preload.split(',') if lang])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+if __name__ == '__main__':
+    main()
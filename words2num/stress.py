@@ -0,0 +1,190 @@
+"""Round-trip stress test with throughput reporting.
+
+    python -m words2num.stress [--langs en,es] [--bands million,centillion]
+                               [--count 2000] [--workers 4] [--seed 0]
+
+Random numbers from each magnitude band are spelled with n2w, together
+with decimals and phrases ending in trailing multipliers ("five point two
+thousand million"), converted back with w2n_batch and compared exactly.
+Correctness and conversions/sec are reported per language, band and kind
+of phrase as JSON, so one run catches both kinds of regression; the exit
+status is 1 if any phrase failed.  Runs in process by default, or spread
+over a process pool with --workers.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from decimal import Decimal
+from multiprocessing import Pool
+
+from . import __version__
+from .base import get_language, w2n_batch
+from .n2w import n2w
+
+# band name: its smallest number; each band spans three decimal digits
+BANDS = {'units': 0}
+for _exp, _name in enumerate(
+        ('thousand', 'million', 'billion', 'trillion', 'quadrillion',
+         'quintillion', 'sextillion', 'septillion', 'octillion',
+         'nonillion', 'decillion', 'undecillion', 'duodecillion',
+         'tredecillion', 'quattuordecillion', 'quindecillion',
+         'sexdecillion', 'septendecillion', 'octodecillion',
+         'novemdecillion', 'vigintillion'), 1):
+    BANDS[_name] = 10 ** (3 * _exp)
+BANDS['centillion'] = 10 ** 303
+
+# kind of phrase: exact mode it is converted with
+KINDS = {'integer': None, 'decimal': 'decimal', 'multiplier': 'decimal'}
+
+# A thousand vigintillion, the first number without words below centillion
+_BELOW_CENTILLION = 10 ** 66
+
+
+def sample(band, rng):
+    """Return a random integer from band."""
+    low = BANDS[band]
+    if low == BANDS['centillion']:
+        # nothing has words between a thousand vigintillion and centillion
+        return (rng.randrange(1, 1000) * low +
+                rng.randrange(_BELOW_CENTILLION))
+    return rng.randrange(low, max(low, 1) * 1000)
+
+
+def _decimal(n, rng):
+    digits = ''.join(rng.choice('0123456789')
+                     for _ in range(rng.randint(1, 8)))
+    return Decimal('{0}.{1}'.format(n, digits))
+
+
+def make_case(lang, band, kind, rng):
+    """Return a random (phrase, expected value) of kind from band."""
+    n = sample(band, rng)
+    if kind == 'integer':
+        return n2w(n, lang), n
+    if kind == 'decimal':
+        number = _decimal(n, rng)
+        return n2w(number, lang), number
+    # Trailing multipliers are scale words, each at least as large as
+    # every word before them
+    n = max(n, 1)
+    number = _decimal(n, rng) if rng.random() < 0.5 else n
+    words = [n2w(number, lang)]
+    scales = _scale_words(lang)
+    largest = max([1] + [value for value, _ in scales if value <= n])
+    places = 0
+    for _ in range(rng.randint(1, 2)):
+        largest, word = rng.choice([(value, word) for value, word in scales
+                                    if value >= largest])
+        words.append(word)
+        places += len(str(largest)) - 1
+    if isinstance(number, int):
+        return ' '.join(words), number * 10 ** places
+    # shift the exponent, as multiplying would round to the context
+    sign, digits, exponent = number.as_tuple()
+    return ' '.join(words), Decimal((sign, digits, exponent + places))
+
+
+_scales = {}
+
+
+def _scale_words(lang):
+    """Return sorted (value, word) pairs of every scale word in lang."""
+    words = _scales.get(lang)
+    if words is None:
+        words = _scales[lang] = sorted(
+            (token.value, word)
+            for word, token in get_language(lang).vocab.items()
+            if token.label == 'X')
+    return words
+
+
+def run_cell(cell):
+    """Check count phrases of one (lang, band, kind, count, seed) cell."""
+    lang, band, kind, count, seed = cell
+    rng = random.Random('{0}:{1}:{2}:{3}'.format(seed, lang, band, kind))
+    cases = [make_case(lang, band, kind, rng) for _ in range(count)]
+    phrases = [phrase for phrase, _ in cases]
+    started = time.perf_counter()
+    results = w2n_batch(phrases, lang, 'return', KINDS[kind])
+    elapsed = time.perf_counter() - started
+    failures = [(phrase, str(expected), str(result))
+                for (phrase, expected), result in zip(cases, results)
+                if isinstance(result, Exception) or result != expected]
+    return {
+        'lang': lang,
+        'band': band,
+        'kind': kind,
+        'conversions': count,
+        'failures': len(failures),
+        'examples': failures[:3],
+        'seconds': round(elapsed, 6),
+        'conversions_per_sec': round(count / elapsed) if elapsed else None,
+    }
+
+
+def run(langs=('en', 'es'), bands=None, kinds=KINDS, count=2000,
+        workers=None, seed=0):
+    """Run every (lang, band, kind) cell and return the report as a dict.
+
+    bands defaults to all of BANDS.  With workers, cells run on a process
+    pool of that size; the phrases checked only depend on seed.
+    """
+    cells = [(lang, band, kind, count, seed) for lang in langs
+             for band in (bands or BANDS) for kind in kinds]
+    started = time.perf_counter()
+    if workers:
+        with Pool(workers) as pool:
+            results = pool.map(run_cell, cells, chunksize=1)
+    else:
+        results = [run_cell(cell) for cell in cells]
+    wall = time.perf_counter() - started
+    conversions = sum(result['conversions'] for result in results)
+    seconds = sum(result['seconds'] for result in results)
+    return {
+        'words2num': __version__,
+        'python': sys.version.split()[0],
+        'seed': seed,
+        'workers': workers,
+        'conversions': conversions,
+        'failures': sum(result['failures'] for result in results),
+        # per process, counting only the conversions themselves
+        'conversions_per_sec': round(conversions / seconds)
+        if seconds else None,
+        'wall_seconds': round(wall, 3),
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m words2num.stress',
+                                     description="Round-trip random numbers "
+                                                 "through n2w and w2n.")
+    parser.add_argument('--langs', default='en,es')
+    parser.add_argument('--bands', default=','.join(BANDS),
+                        help="comma-separated bands from: " +
+                             ', '.join(BANDS))
+    parser.add_argument('--kinds', default=','.join(KINDS))
+    parser.add_argument('--count', type=int, default=2000,
+                        help="phrases per language, band and kind")
+    parser.add_argument('--workers', type=int,
+                        help="run on a process pool of this size")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    bands = args.bands.split(',')
+    kinds = args.kinds.split(',')
+    for name, chosen, known in (('band', bands, BANDS),
+                                ('kind', kinds, KINDS)):
+        unknown = [value for value in chosen if value not in known]
+        if unknown:
+            parser.error("unknown {0}: {1}".format(name, ', '.join(unknown)))
+    report = run(args.langs.split(','), bands, kinds, args.count,
+                 args.workers, args.seed)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(1 if report['failures'] else 0)
+
+
+if __name__ == '__main__':
+    main()